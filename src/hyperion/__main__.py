@@ -23,7 +23,7 @@ from hyperion.external_interaction.callbacks.logging_callback import (
 )
 from hyperion.parameters.constants import Actions, Status
 from hyperion.parameters.internal_parameters import InternalParameters
-from hyperion.tracing import TRACER
+from hyperion.tracing import TRACER, set_up_tracing
 from hyperion.utils.context import setup_context
 
 VERBOSE_EVENT_LOGGING: Optional[bool] = None
@@ -295,6 +295,7 @@ if __name__ == "__main__":
         dev_mode,
         skip_startup_connection,
     ) = cli_arg_parse()
+    set_up_tracing()
     hyperion.log.set_up_logging_handlers(
         logging_level=logging_level, dev_mode=bool(dev_mode)
     )
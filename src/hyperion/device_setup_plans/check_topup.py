@@ -1,6 +1,8 @@
 import bluesky.plan_stubs as bps
 from dodal.devices.synchrotron import Synchrotron, SynchrotronMode
+from ophyd.status import SubscriptionStatus
 
+from hyperion.device_setup_plans.utils import wait_for_status
 from hyperion.log import LOGGER
 
 ALLOWED_MODES = [SynchrotronMode.USER.value, SynchrotronMode.SPECIAL.value]
@@ -41,10 +43,14 @@ def _delay_to_avoid_topup(total_run_time, time_to_topup):
 
 
 def wait_for_topup_complete(synchrotron):
-    start = yield from bps.rd(synchrotron.top_up.start_countdown)
-    while start == COUNTDOWN_DURING_TOPUP:
-        yield from bps.sleep(0.1)
-        start = yield from bps.rd(synchrotron.top_up.start_countdown)
+    # Completes on the first start_countdown update after the top up, checking the
+    # current value straight away. Like the polling loop this replaced there is no
+    # timeout, a stopped plan cancels the subscription through wait_for_status
+    topup_complete = SubscriptionStatus(
+        synchrotron.top_up.start_countdown,
+        lambda value, **_: value != COUNTDOWN_DURING_TOPUP,
+    )
+    yield from wait_for_status(topup_complete)
 
 
 def check_topup_and_wait_if_necessary(
@@ -68,10 +74,12 @@ def check_topup_and_wait_if_necessary(
         yield from bps.null()
         return
     tot_run_time = total_exposure_time + ops_time
-    end_topup = yield from bps.rd(synchrotron.top_up.end_countdown)
-    time_to_wait = (
-        end_topup if _delay_to_avoid_topup(tot_run_time, time_to_topup) else 0.0
-    )
+    if not _delay_to_avoid_topup(tot_run_time, time_to_topup):
+        # Collection will finish before the topup, so skip reading end_countdown
+        # and re-checking the gate after sleeping
+        yield from bps.null()
+        return
+    time_to_wait = yield from bps.rd(synchrotron.top_up.end_countdown)
 
     yield from bps.sleep(time_to_wait)
 
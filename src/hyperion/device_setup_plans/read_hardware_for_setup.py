@@ -22,21 +22,27 @@ def read_hardware_for_ispyb_pre_collection(
     hyperion.log.LOGGER.info(
         "Reading status of beamline parameters for ispyb deposition."
     )
-    yield from bps.create(
-        name=ISPYB_HARDWARE_READ_PLAN
-    )  # gives name to event *descriptor* document
-    yield from bps.read(undulator.current_gap)
-    yield from bps.read(synchrotron.machine_status.synchrotron_mode)
-    yield from bps.read(s4_slit_gaps.xgap)
-    yield from bps.read(s4_slit_gaps.ygap)
-    yield from bps.save()
+    signals_to_read_pre_collection = [
+        undulator.current_gap,
+        synchrotron.machine_status.synchrotron_mode,
+        s4_slit_gaps.xgap,
+        s4_slit_gaps.ygap,
+    ]
+    # Triggers all the readings as a single group before reading them into one event
+    # The name given to trigger_and_read is the name of the event *descriptor* document
+    yield from bps.trigger_and_read(
+        signals_to_read_pre_collection, name=ISPYB_HARDWARE_READ_PLAN
+    )
 
 
 def read_hardware_for_ispyb_during_collection(attenuator: Attenuator, flux: Flux):
     hyperion.log.LOGGER.info(
         "Reading status of beamline parameters for ispyb deposition."
     )
-    yield from bps.create(name=ISPYB_TRANSMISSION_FLUX_READ_PLAN)
-    yield from bps.read(attenuator.actual_transmission)
-    yield from bps.read(flux.flux_reading)
-    yield from bps.save()
+    signals_to_read_during_collection = [
+        attenuator.actual_transmission,
+        flux.flux_reading,
+    ]
+    yield from bps.trigger_and_read(
+        signals_to_read_during_collection, name=ISPYB_TRANSMISSION_FLUX_READ_PLAN
+    )
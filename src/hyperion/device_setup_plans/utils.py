@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import Future
 from typing import Generator
 
 from bluesky import plan_stubs as bps
@@ -5,6 +7,8 @@ from bluesky import preprocessors as bpp
 from bluesky.utils import Msg
 from dodal.devices.detector_motion import DetectorMotion, ShutterState
 from dodal.devices.eiger import EigerDetector
+from ophyd.status import StatusBase
+from ophyd.utils import InvalidState
 
 from hyperion.device_setup_plans.position_detector import (
     set_detector_z_position,
@@ -12,6 +16,26 @@ from hyperion.device_setup_plans.position_detector import (
 )
 
 
+def wait_for_status(status: StatusBase) -> Generator[Msg, None, bool]:
+    """Block the plan until the given ophyd status completes, returning whether it
+    succeeded. If the plan is stopped first the status is failed, so that any
+    subscriptions it holds are cleared."""
+    if status.done:
+        return status.success
+    future: Future[bool] = Future()
+    status.add_callback(lambda s: future.set_result(s.success))
+    try:
+        yield from bps.wait_for([lambda: asyncio.wrap_future(future)])
+    finally:
+        if not status.done:
+            try:
+                status.set_exception(RuntimeError("Plan stopped waiting on status"))
+            except InvalidState:
+                # The status completed between the check and failing it
+                pass
+    return future.result()
+
+
 def start_preparing_data_collection_then_do_plan(
     eiger: EigerDetector,
     detector_motion: DetectorMotion,
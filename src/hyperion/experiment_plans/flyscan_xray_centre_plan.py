@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import threading
 from typing import TYPE_CHECKING, Any
 
 import bluesky.plan_stubs as bps
@@ -23,6 +24,8 @@ from dodal.devices.synchrotron import Synchrotron
 from dodal.devices.undulator import Undulator
 from dodal.devices.xbpm_feedback import XBPMFeedback
 from dodal.devices.zebra import Zebra
+from ophyd.status import Status
+from ophyd.utils import InvalidState
 
 import hyperion.log
 from hyperion.device_setup_plans.check_topup import check_topup_and_wait_if_necessary
@@ -35,6 +38,7 @@ from hyperion.device_setup_plans.setup_zebra import (
     set_zebra_shutter_to_manual,
     setup_zebra_for_gridscan,
 )
+from hyperion.device_setup_plans.utils import wait_for_status
 from hyperion.device_setup_plans.xbpm_feedback import (
     transmission_and_xbpm_feedback_for_collection_decorator,
 )
@@ -99,6 +103,7 @@ def create_devices(context: BlueskyContext) -> FlyScanXRayCentreComposite:
 def set_aperture_for_bbox_size(
     aperture_device: ApertureScatterguard,
     bbox_size: list[int],
+    group: str | None = None,
 ):
     # bbox_size is [x,y,z], for i03 we only care about x
     assert aperture_device.aperture_positions is not None
@@ -117,25 +122,44 @@ def set_aperture_for_bbox_size(
         md={"subplan_name": "change_aperture", "aperture_size": selected_aperture}
     )
     def set_aperture():
-        yield from bps.abs_set(aperture_device, aperture_size_positions)
+        yield from bps.abs_set(aperture_device, aperture_size_positions, group=group)
 
     yield from set_aperture()
 
 
 def wait_for_gridscan_valid(fgs_motors: FastGridScan, timeout=0.5):
     hyperion.log.LOGGER.info("Waiting for valid fgs_params")
-    SLEEP_PER_CHECK = 0.1
-    times_to_check = int(timeout / SLEEP_PER_CHECK)
-    for _ in range(times_to_check):
-        scan_invalid = yield from bps.rd(fgs_motors.scan_invalid)
-        pos_counter = yield from bps.rd(fgs_motors.position_counter)
-        hyperion.log.LOGGER.debug(
-            f"Scan invalid: {scan_invalid} and position counter: {pos_counter}"
-        )
-        if not scan_invalid and pos_counter == 0:
-            hyperion.log.LOGGER.info("Gridscan scan valid and position counter reset")
-            return
-        yield from bps.sleep(SLEEP_PER_CHECK)
+    scan_valid = Status(timeout=timeout)
+    # Both PVs call back on their own CA threads, so only one may finish the status
+    check_lock = threading.Lock()
+
+    def check_scan_valid(*_, **__):
+        with check_lock:
+            scan_invalid = fgs_motors.scan_invalid.get()
+            pos_counter = fgs_motors.position_counter.get()
+            hyperion.log.LOGGER.debug(
+                f"Scan invalid: {scan_invalid} and position counter: {pos_counter}"
+            )
+            if scan_invalid or pos_counter != 0 or scan_valid.done:
+                return
+            try:
+                scan_valid.set_finished()
+            except InvalidState:
+                # The timeout fired between the check and finishing
+                pass
+
+    # Wake as soon as either PV changes rather than polling on a fixed tick
+    signals = [fgs_motors.scan_invalid, fgs_motors.position_counter]
+    subscriptions = [(signal, signal.subscribe(check_scan_valid)) for signal in signals]
+    try:
+        check_scan_valid()
+        valid = yield from wait_for_status(scan_valid)
+    finally:
+        for signal, subscription in subscriptions:
+            signal.unsubscribe(subscription)
+    if valid:
+        hyperion.log.LOGGER.info("Gridscan scan valid and position counter reset")
+        return
     raise WarningException("Scan invalid - pin too long/short/bent and out of range")
 
 
@@ -241,16 +265,20 @@ def run_gridscan_and_move(
     # it might not be ideal to block for this, see #327
     xray_centre, bbox_size = subscriptions.zocalo_handler.wait_for_results(initial_xyz)
 
+    # The aperture and sample motors are independent so are moved at the same time
     if bbox_size is not None:
         with TRACER.start_span("change_aperture"):
             yield from set_aperture_for_bbox_size(
-                fgs_composite.aperture_scatterguard, bbox_size
+                fgs_composite.aperture_scatterguard, bbox_size, group="move_to_result"
             )
 
     # once we have the results, go to the appropriate position
     hyperion.log.LOGGER.info("Moving to centre of mass.")
     with TRACER.start_span("move_to_result"):
-        yield from move_x_y_z(fgs_composite.sample_motors, *xray_centre, wait=True)
+        yield from move_x_y_z(
+            fgs_composite.sample_motors, *xray_centre, group="move_to_result"
+        )
+        yield from bps.wait("move_to_result")
 
     if parameters.experiment_params.set_stub_offsets:
         hyperion.log.LOGGER.info("Recentring smargon co-ordinate system to this point.")
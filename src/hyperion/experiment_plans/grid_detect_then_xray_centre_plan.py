@@ -92,8 +92,10 @@ def create_parameters_for_flyscan_xray_centre(
     grid_scan_with_edge_params: GridScanWithEdgeDetectInternalParameters,
     grid_parameters: GridScanParams,
 ) -> GridscanInternalParameters:
+    # The hyperion params go through JSON so their json_encoders turn the detector and
+    # ispyb fields back into the form the validators expect
     params_json = json.loads(grid_scan_with_edge_params.json())
-    params_json["experiment_params"] = json.loads(grid_parameters.json())
+    params_json["experiment_params"] = grid_parameters.dict()
     flyscan_xray_centre_parameters = GridscanInternalParameters(**params_json)
     LOGGER.info(f"Parameters for FGS: {flyscan_xray_centre_parameters}")
     return flyscan_xray_centre_parameters
@@ -150,12 +152,11 @@ def detect_grid_and_do_gridscan(
         oav_callback.out_upper_left[0] + [oav_callback.out_upper_left[1][1]]
     )
 
-    # Hack because the callback returns the list in inverted order
     parameters.hyperion_params.ispyb_params.xtal_snapshots_omega_start = (
-        oav_callback.snapshot_filenames[0][::-1]
+        oav_callback.snapshot_filenames[0]
     )
     parameters.hyperion_params.ispyb_params.xtal_snapshots_omega_end = (
-        oav_callback.snapshot_filenames[1][::-1]
+        oav_callback.snapshot_filenames[1]
     )
     parameters.hyperion_params.ispyb_params.upper_left = out_upper_left
 
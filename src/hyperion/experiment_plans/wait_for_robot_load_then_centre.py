@@ -3,13 +3,14 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
-import bluesky.plan_stubs as bps
 from blueapi.core import BlueskyContext, MsgGenerator
 from dodal.devices.eiger import EigerDetector
 from dodal.devices.smargon import Smargon
+from ophyd.status import SubscriptionStatus
 
 from hyperion.device_setup_plans.utils import (
     start_preparing_data_collection_then_do_plan,
+    wait_for_status,
 )
 from hyperion.experiment_plans.grid_detect_then_xray_centre_plan import (
     GridDetectThenXRayCentreComposite,
@@ -40,14 +41,12 @@ def wait_for_smargon_not_disabled(smargon: Smargon, timeout=60):
     connection between the robot and the smargon.
     """
     LOGGER.info("Waiting for smargon enabled")
-    SLEEP_PER_CHECK = 0.1
-    times_to_check = int(timeout / SLEEP_PER_CHECK)
-    for _ in range(times_to_check):
-        smargon_disabled = yield from bps.rd(smargon.disabled)
-        if not smargon_disabled:
-            LOGGER.info("Smargon now enabled")
-            return
-        yield from bps.sleep(SLEEP_PER_CHECK)
+    smargon_enabled = SubscriptionStatus(
+        smargon.disabled, lambda value, **_: not value, timeout=timeout
+    )
+    if (yield from wait_for_status(smargon_enabled)):
+        LOGGER.info("Smargon now enabled")
+        return
     raise TimeoutError(
         "Timed out waiting for smargon to become enabled after robot load"
     )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 
 from hyperion.external_interaction.callbacks.plan_reactive_callback import (
     PlanReactiveCallback,
@@ -34,7 +34,8 @@ class BaseISPyBCallback(PlanReactiveCallback):
             None
         )
         self.ispyb: StoreInIspyb
-        self.descriptors: Dict[str, dict] = {}
+        # Only the names of descriptors are needed to tell which events to handle
+        self.descriptor_names: Dict[str, Optional[str]] = {}
         self.ispyb_config = os.environ.get("ISPYB_CONFIG_PATH", SIM_ISPYB_CONFIG)
         if self.ispyb_config == SIM_ISPYB_CONFIG:
             ISPYB_LOGGER.warning(
@@ -43,13 +44,18 @@ class BaseISPyBCallback(PlanReactiveCallback):
             )
         self.uid_to_finalize_on: Optional[str] = None
         self.ispyb_ids: IspybIds = IspybIds()
+        # The events to handle, by the name of their descriptor
+        self._event_handlers: Dict[str, Callable[[dict], None]] = {
+            ISPYB_HARDWARE_READ_PLAN: self._handle_hardware_read,
+            ISPYB_TRANSMISSION_FLUX_READ_PLAN: self._handle_transmission_flux_read,
+        }
 
     def activity_gated_start(self, doc: dict):
         if self.uid_to_finalize_on is None:
             self.uid_to_finalize_on = doc.get("uid")
 
     def activity_gated_descriptor(self, doc: dict):
-        self.descriptors[doc["uid"]] = doc
+        self.descriptor_names[doc["uid"]] = doc.get("name")
 
     def activity_gated_event(self, doc: dict):
         """Subclasses should extend this to add a call to set_dcig_tag from
@@ -57,34 +63,37 @@ class BaseISPyBCallback(PlanReactiveCallback):
         ISPYB_LOGGER.debug("ISPyB handler received event document.")
         assert self.ispyb is not None, "ISPyB deposition wasn't initialised!"
         assert self.params is not None, "ISPyB handler didn't recieve parameters!"
-        event_descriptor = self.descriptors[doc["descriptor"]]
+        event_handler = self._event_handlers.get(
+            self.descriptor_names[doc["descriptor"]]
+        )
+        if event_handler is not None:
+            event_handler(doc)
 
-        event_descriptor = self.descriptors[doc["descriptor"]]
-        if event_descriptor.get("name") == ISPYB_HARDWARE_READ_PLAN:
-            self.params.hyperion_params.ispyb_params.undulator_gap = doc["data"][
-                "undulator_current_gap"
-            ]
-            self.params.hyperion_params.ispyb_params.synchrotron_mode = doc["data"][
-                "synchrotron_machine_status_synchrotron_mode"
-            ]
-            self.params.hyperion_params.ispyb_params.slit_gap_size_x = doc["data"][
-                "s4_slit_gaps_xgap"
-            ]
-            self.params.hyperion_params.ispyb_params.slit_gap_size_y = doc["data"][
-                "s4_slit_gaps_ygap"
-            ]
+    def _handle_hardware_read(self, doc: dict):
+        assert self.params is not None
+        self.params.hyperion_params.ispyb_params.undulator_gap = doc["data"][
+            "undulator_current_gap"
+        ]
+        self.params.hyperion_params.ispyb_params.synchrotron_mode = doc["data"][
+            "synchrotron_machine_status_synchrotron_mode"
+        ]
+        self.params.hyperion_params.ispyb_params.slit_gap_size_x = doc["data"][
+            "s4_slit_gaps_xgap"
+        ]
+        self.params.hyperion_params.ispyb_params.slit_gap_size_y = doc["data"][
+            "s4_slit_gaps_ygap"
+        ]
 
-        if event_descriptor.get("name") == ISPYB_TRANSMISSION_FLUX_READ_PLAN:
-            self.params.hyperion_params.ispyb_params.transmission_fraction = doc[
-                "data"
-            ]["attenuator_actual_transmission"]
-            self.params.hyperion_params.ispyb_params.flux = doc["data"][
-                "flux_flux_reading"
-            ]
+    def _handle_transmission_flux_read(self, doc: dict):
+        assert self.params is not None
+        self.params.hyperion_params.ispyb_params.transmission_fraction = doc["data"][
+            "attenuator_actual_transmission"
+        ]
+        self.params.hyperion_params.ispyb_params.flux = doc["data"]["flux_flux_reading"]
 
-            ISPYB_LOGGER.info("Creating ispyb entry.")
-            self.ispyb_ids = self.ispyb.begin_deposition()
-            ISPYB_LOGGER.info(f"Recieved ISPYB IDs: {self.ispyb_ids}")
+        ISPYB_LOGGER.info("Creating ispyb entry.")
+        self.ispyb_ids = self.ispyb.begin_deposition()
+        ISPYB_LOGGER.info(f"Recieved ISPYB IDs: {self.ispyb_ids}")
 
     def activity_gated_stop(self, doc: dict):
         """Subclasses must check that they are recieving a stop document for the correct
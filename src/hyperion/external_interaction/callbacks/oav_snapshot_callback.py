@@ -10,11 +10,12 @@ class OavSnapshotCallback(CallbackBase):
     def event(self, doc):
         data = doc.get("data")
 
+        # Stored in the order ISPyB expects them, full overlay first
         self.snapshot_filenames.append(
             [
-                data.get("oav_snapshot_last_saved_path"),
-                data.get("oav_snapshot_last_path_outer"),
                 data.get("oav_snapshot_last_path_full_overlay"),
+                data.get("oav_snapshot_last_path_outer"),
+                data.get("oav_snapshot_last_saved_path"),
             ]
         )
 
@@ -74,8 +74,9 @@ class XrayCentreZocaloCallback(PlanReactiveCallback):
             self.do_fgs_uid = doc.get("uid")
             if self.ispyb.ispyb_ids.data_collection_ids is not None:
                 assert isinstance(self.ispyb.ispyb_ids.data_collection_ids, tuple)
-                for id in self.ispyb.ispyb_ids.data_collection_ids:
-                    self.zocalo_interactor.run_start(id)
+                self.zocalo_interactor.run_start_many(
+                    self.ispyb.ispyb_ids.data_collection_ids
+                )
             else:
                 raise ISPyBDepositionNotMade("ISPyB deposition was not initialised!")
 
@@ -87,8 +88,9 @@ class XrayCentreZocaloCallback(PlanReactiveCallback):
             if self.ispyb.ispyb_ids == IspybIds():
                 raise ISPyBDepositionNotMade("ISPyB deposition was not initialised!")
             assert isinstance(self.ispyb.ispyb_ids.data_collection_ids, tuple)
-            for id in self.ispyb.ispyb_ids.data_collection_ids:
-                self.zocalo_interactor.run_end(id)
+            self.zocalo_interactor.run_end_many(
+                self.ispyb.ispyb_ids.data_collection_ids
+            )
             self.processing_start_time = time.time()
 
     def wait_for_results(self, fallback_xyz: ndarray) -> tuple[ndarray, Optional[list]]:
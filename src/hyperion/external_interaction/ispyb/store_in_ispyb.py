@@ -3,15 +3,12 @@ from __future__ import annotations
 import datetime
 import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
 import dodal.devices.oav.utils as oav_utils
 import ispyb
-import ispyb.sqlalchemy
 from dodal.devices.detector import DetectorParams
-from ispyb.connector.mysqlsp.main import ISPyBMySQLSPConnector as Connector
-from ispyb.sp.core import Core
-from ispyb.sp.mxacquisition import MXAcquisition
 from numpy import ndarray
 from pydantic import BaseModel
 
@@ -25,6 +22,10 @@ from hyperion.log import ISPYB_LOGGER
 from hyperion.tracing import TRACER
 
 if TYPE_CHECKING:
+    from ispyb.connector.mysqlsp.main import ISPyBMySQLSPConnector as Connector
+    from ispyb.sp.core import Core
+    from ispyb.sp.mxacquisition import MXAcquisition
+
     from hyperion.parameters.plan_specific.gridscan_internal_params import (
         GridscanInternalParameters,
     )
@@ -35,6 +36,7 @@ if TYPE_CHECKING:
 I03_EIGER_DETECTOR = 78
 EIGER_FILE_SUFFIX = "h5"
 VISIT_PATH_REGEX = r".+/([a-zA-Z]{2}\d{4,5}-\d{1,3})(/?$)"
+_VISIT_PATH_PATTERN = re.compile(VISIT_PATH_REGEX)
 
 
 class IspybIds(BaseModel):
@@ -54,6 +56,9 @@ class StoreInIspyb(ABC):
         self.experiment_type: str
         self.xtal_snapshots: list[str]
         self.data_collection_group_id: int
+        self._held_connection_stack = ExitStack()
+        self._held_connection: Connector | None = None
+        self._session_id: int | None = None
 
     @abstractmethod
     def _store_scan_data(self, conn: Connector) -> tuple:
@@ -77,11 +82,58 @@ class StoreInIspyb(ABC):
     def end_deposition(self, success: str, reason: str):
         pass
 
+    def _hold_connection(self) -> Connector:
+        """Open a connection to ISPyB, if one isn't already held, which is then reused
+        for the rest of the deposition until it is released in end_deposition.
+
+        The connection is not re-opened if the server drops it, e.g. on an idle
+        timeout during a very long collection; the next call will raise and the
+        deposition fails as it would have for a connection error. A store that is
+        abandoned without end_deposition keeps its connection until it is garbage
+        collected."""
+        if self._held_connection is None:
+            conn = self._held_connection_stack.enter_context(
+                ispyb.open(self.ISPYB_CONFIG_PATH)
+            )
+            assert conn is not None, "Failed to connect to ISPyB!"
+            self._held_connection = conn
+        return self._held_connection
+
+    @contextmanager
+    def _releasing_held_connection(self) -> Iterator[None]:
+        """Release the held connection when the context exits, handing any exception
+        raised in it on to the connection's own exit."""
+        stack, self._held_connection_stack = self._held_connection_stack, ExitStack()
+        try:
+            with stack:
+                yield
+        finally:
+            self._held_connection = None
+
+    def _store_scan_data_on_held_connection(self) -> tuple:
+        """Store the scan data over the deposition's held connection. If this fails
+        end_deposition will never be called, so the connection is released here."""
+        try:
+            return self._store_scan_data(self._hold_connection())
+        except Exception:
+            with self._releasing_held_connection():
+                raise
+
+    @contextmanager
+    def _connection(self) -> Iterator[Connector]:
+        """Use the held connection if there is one, otherwise open one just for the
+        duration of the context."""
+        if self._held_connection is not None:
+            yield self._held_connection
+        else:
+            with ispyb.open(self.ISPYB_CONFIG_PATH) as conn:
+                assert conn is not None, "Failed to connect to ISPyB!"
+                yield conn
+
     def append_to_comment(
         self, data_collection_id: int, comment: str, delimiter: str = " "
     ) -> None:
-        with ispyb.open(self.ISPYB_CONFIG_PATH) as conn:
-            assert conn is not None, "Failed to connect to ISPyB!"
+        with self._connection() as conn:
             mx_acquisition: MXAcquisition = conn.mx_acquisition
             mx_acquisition.update_data_collection_append_comments(
                 data_collection_id, comment, delimiter
@@ -102,37 +154,43 @@ class StoreInIspyb(ABC):
             return self.get_visit_string_from_path(self.detector_params.directory)
 
     def get_visit_string_from_path(self, path):
-        match = re.search(VISIT_PATH_REGEX, path) if path else None
+        match = _VISIT_PATH_PATTERN.search(path) if path else None
         return match.group(1) if match else None
 
-    def update_scan_with_end_time_and_status(
+    def update_scans_with_end_time_and_status(
         self,
         end_time: str,
         run_status: str,
         reason: str,
-        data_collection_id: int,
+        data_collection_ids: Sequence[int],
         data_collection_group_id: int,
     ) -> None:
+        """Update the end time, status and, if given, the status reason comment of
+        all of the data collections over a single ISPyB connection."""
         assert self.ispyb_params is not None and self.detector_params is not None
-        if reason is not None and reason != "":
-            self.append_to_comment(data_collection_id, f"{run_status} reason: {reason}")
-
-        with ispyb.open(self.ISPYB_CONFIG_PATH) as conn:
-            assert conn is not None, "Failed to connect to ISPyB!"
 
+        with self._connection() as conn:
             mx_acquisition: MXAcquisition = conn.mx_acquisition
 
-            params = mx_acquisition.get_data_collection_params()
-            params["id"] = data_collection_id
-            params["parentid"] = data_collection_group_id
-            params["endtime"] = end_time
-            params["run_status"] = run_status
+            if reason is not None and reason != "":
+                for data_collection_id in data_collection_ids:
+                    mx_acquisition.update_data_collection_append_comments(
+                        data_collection_id, f"{run_status} reason: {reason}", " "
+                    )
 
-            mx_acquisition.upsert_data_collection(list(params.values()))
+            for data_collection_id in data_collection_ids:
+                params = mx_acquisition.get_data_collection_params()
+                params["id"] = data_collection_id
+                params["parentid"] = data_collection_group_id
+                params["endtime"] = end_time
+                params["run_status"] = run_status
 
-    def _end_deposition(self, dcid: int, success: str, reason: str):
+                mx_acquisition.upsert_data_collection(list(params.values()))
+
+    def _end_deposition(self, dcids: Sequence[int], success: str, reason: str):
         """Write the end of data_collection data.
         Args:
+            dcids (Sequence[int]): The data collections to end
             success (str): The success of the run, could be fail or abort
             reason (str): If the run failed, the reason why
         """
@@ -145,14 +203,28 @@ class StoreInIspyb(ABC):
             run_status = "DataCollection Successful"
         current_time = self.get_current_time_string()
         assert self.data_collection_group_id is not None
-        self.update_scan_with_end_time_and_status(
+        self.update_scans_with_end_time_and_status(
             current_time,
             run_status,
             reason,
-            dcid,
+            dcids,
             self.data_collection_group_id,
         )
 
+    def _get_session_id(self, core: Core) -> int:
+        """Look up the session ID for this deposition's visit, which is shared by the
+        data collection group and all of its data collections."""
+        assert self.ispyb_params is not None
+        if self._session_id is None:
+            visit_string = self.get_visit_string()
+            try:
+                self._session_id = core.retrieve_visit_id(visit_string)
+            except ispyb.NoResult:
+                raise Exception(
+                    f"Not found - session ID for visit {visit_string} where self.ispyb_params.visit_path is {self.ispyb_params.visit_path}"
+                )
+        return self._session_id
+
     def _store_position_table(self, conn: Connector, dc_id: int) -> int:
         assert self.ispyb_params is not None
         mx_acquisition: MXAcquisition = conn.mx_acquisition
@@ -169,15 +241,8 @@ class StoreInIspyb(ABC):
 
     def _store_data_collection_group_table(self, conn: Connector) -> int:
         assert self.ispyb_params is not None
-        core: Core = conn.core
         mx_acquisition: MXAcquisition = conn.mx_acquisition
-
-        try:
-            session_id = core.retrieve_visit_id(self.get_visit_string())
-        except ispyb.NoResult:
-            raise Exception(
-                f"Not found - session ID for visit {self.get_visit_string()} where self.ispyb_params.visit_path is {self.ispyb_params.visit_path}"
-            )
+        session_id = self._get_session_id(conn.core)
 
         params = mx_acquisition.get_data_collection_group_params()
         params["parentid"] = session_id
@@ -197,14 +262,8 @@ class StoreInIspyb(ABC):
             and self.xtal_snapshots is not None
         )
 
-        core: Core = conn.core
         mx_acquisition: MXAcquisition = conn.mx_acquisition
-        try:
-            session_id = core.retrieve_visit_id(self.get_visit_string())
-        except ispyb.NoResult:
-            raise Exception(
-                f"Not found - session ID for visit {self.get_visit_string()}"
-            )
+        session_id = self._get_session_id(conn.core)
 
         params = mx_acquisition.get_data_collection_params()
 
@@ -308,16 +367,15 @@ class StoreRotationInIspyb(StoreInIspyb):
         return data_collection_id, data_collection_group_id
 
     def begin_deposition(self) -> IspybIds:
-        with ispyb.open(self.ISPYB_CONFIG_PATH) as conn:
-            assert conn is not None, "Failed to connect to ISPyB"
-            ids = self._store_scan_data(conn)
-            return IspybIds(data_collection_ids=ids[0], data_collection_group_id=ids[1])
+        ids = self._store_scan_data_on_held_connection()
+        return IspybIds(data_collection_ids=ids[0], data_collection_group_id=ids[1])
 
     def end_deposition(self, success: str, reason: str):
-        assert (
-            self.data_collection_id is not None
-        ), "Can't end ISPyB deposition, data_collection IDs is missing"
-        self._end_deposition(self.data_collection_id, success, reason)
+        with self._releasing_held_connection():
+            assert (
+                self.data_collection_id is not None
+            ), "Can't end ISPyB deposition, data_collection IDs is missing"
+            self._end_deposition([self.data_collection_id], success, reason)
 
     def _construct_comment(self) -> str:
         return "Hyperion rotation scan"
@@ -356,11 +414,11 @@ class StoreGridscanInIspyb(StoreInIspyb):
         )
 
     def end_deposition(self, success: str, reason: str):
-        assert (
-            self.data_collection_ids is not None
-        ), "Can't end ISPyB deposition, data_collection IDs are missing"
-        for id in self.data_collection_ids:
-            self._end_deposition(id, success, reason)
+        with self._releasing_held_connection():
+            assert (
+                self.data_collection_ids is not None
+            ), "Can't end ISPyB deposition, data_collection IDs are missing"
+            self._end_deposition(self.data_collection_ids, success, reason)
 
     def store_grid_scan(self, full_params: GridscanInternalParameters):
         self.full_params = full_params
@@ -375,10 +433,9 @@ class StoreGridscanInIspyb(StoreInIspyb):
         ]
         self.y_steps = full_params.experiment_params.y_steps
         self.y_step_size = full_params.experiment_params.y_step_size
+        self._session_id = None
 
-        with ispyb.open(self.ISPYB_CONFIG_PATH) as conn:
-            assert conn is not None, "Failed to connect to ISPyB"
-            return self._store_scan_data(conn)
+        return self._store_scan_data_on_held_connection()
 
     def _mutate_data_collection_params_for_experiment(
         self, params: dict[str, Any]
@@ -3,7 +3,7 @@ import queue
 import socket
 from datetime import datetime, timedelta
 from time import sleep
-from typing import Optional
+from typing import Optional, Sequence
 
 import workflows.recipe
 import workflows.transport
@@ -33,19 +33,22 @@ class ZocaloInteractor:
         transport.connect()
         return transport
 
-    def _send_to_zocalo(self, parameters: dict):
+    def _send_to_zocalo(self, *parameters: dict):
+        """Sends one mimas message per set of parameters, sharing a single
+        connection between them."""
         transport = self._get_zocalo_connection()
 
         try:
-            message = {
-                "recipes": ["mimas"],
-                "parameters": parameters,
-            }
             header = {
                 "zocalo.go.user": getpass.getuser(),
                 "zocalo.go.host": socket.gethostname(),
             }
-            transport.send("processing_recipe", message, headers=header)
+            for message_parameters in parameters:
+                message = {
+                    "recipes": ["mimas"],
+                    "parameters": message_parameters,
+                }
+                transport.send("processing_recipe", message, headers=header)
         finally:
             transport.disconnect()
 
@@ -57,10 +60,23 @@ class ZocaloInteractor:
             data_collection_id (int): The ID of the data collection representing the
                                     gridscan in ISPyB
         """
+        self.run_start_many([data_collection_id])
+
+    def run_start_many(self, data_collection_ids: Sequence[int]):
+        """Tells the data analysis pipeline we have started a run for each of the
+        given data collections, over one connection.
+        Assumes that appropriate data has already been put into ISPyB
+
+        Args:
+            data_collection_ids (Sequence[int]): The IDs of the data collections
+                                    representing the gridscan in ISPyB
+        """
         hyperion.log.LOGGER.info(
-            f"Submitting to zocalo with ispyb id {data_collection_id}"
+            f"Submitting to zocalo with ispyb ids {list(data_collection_ids)}"
+        )
+        self._send_to_zocalo(
+            *({"event": "start", "ispyb_dcid": dcid} for dcid in data_collection_ids)
         )
-        self._send_to_zocalo({"event": "start", "ispyb_dcid": data_collection_id})
 
     def run_end(self, data_collection_id: int):
         """Tells the data analysis pipeline we have finished a run.
@@ -71,11 +87,25 @@ class ZocaloInteractor:
                                     gridscan in ISPyB
 
         """
+        self.run_end_many([data_collection_id])
+
+    def run_end_many(self, data_collection_ids: Sequence[int]):
+        """Tells the data analysis pipeline we have finished a run for each of the
+        given data collections, over one connection.
+        Assumes that appropriate data has already been put into ISPyB
+
+        Args:
+            data_collection_ids (Sequence[int]): The IDs of the data collections
+                                    representing the gridscan in ISPyB
+        """
         self._send_to_zocalo(
-            {
-                "event": "end",
-                "ispyb_dcid": data_collection_id,
-            }
+            *(
+                {
+                    "event": "end",
+                    "ispyb_dcid": dcid,
+                }
+                for dcid in data_collection_ids
+            )
         )
 
     def wait_for_result(
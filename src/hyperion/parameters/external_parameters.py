@@ -1,29 +1,48 @@
 from __future__ import annotations
 
 import json
-from os.path import join
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 
 from hyperion.log import LOGGER
-from hyperion.parameters.constants import PARAMETER_SCHEMA_DIRECTORY
+
+# Found from this module rather than the working directory hyperion is run from
+SCHEMA_DIRECTORY = Path(__file__).parent.absolute() / "schemas"
+
+
+@cache
+def _load_parameter_schemas() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Load and check the full parameter schema, along with every schema it can
+    refer to keyed by URI, so that validation doesn't need to touch the disk."""
+    schema_store = {
+        schema_file.as_uri(): json.loads(schema_file.read_text())
+        for schema_file in SCHEMA_DIRECTORY.rglob("*.json")
+    }
+    full_schema = schema_store[
+        (SCHEMA_DIRECTORY / "full_external_parameters_schema.json").as_uri()
+    ]
+    jsonschema.validators.validator_for(full_schema).check_schema(full_schema)
+    return full_schema, schema_store
 
 
 def validate_raw_parameters_from_dict(dict_params: dict[str, Any]):
-    with open(
-        join(PARAMETER_SCHEMA_DIRECTORY, "full_external_parameters_schema.json"), "r"
-    ) as f:
-        full_schema = json.load(f)
+    full_schema, schema_store = _load_parameter_schemas()
 
-    path = Path(PARAMETER_SCHEMA_DIRECTORY).absolute()
     resolver = jsonschema.validators.RefResolver(
-        base_uri=f"{path.as_uri()}/",
+        base_uri=f"{SCHEMA_DIRECTORY.as_uri()}/",
         referrer=True,
+        store=schema_store,
     )
     LOGGER.debug(f"Raw JSON recieved: {dict_params}")
-    jsonschema.validate(dict_params, full_schema, resolver=resolver)
+    # As jsonschema.validate, without checking the already checked schema each time
+    validator = jsonschema.validators.validator_for(full_schema)(
+        full_schema, resolver=resolver
+    )
+    if error := jsonschema.exceptions.best_match(validator.iter_errors(dict_params)):
+        raise error
     return dict_params
 
 
@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from typing import Any
+from functools import cache
+from typing import Any, Sequence
 
 from dodal.devices.eiger import DetectorParams
 from pydantic import BaseModel, root_validator
@@ -41,37 +42,51 @@ class HyperionParameters(BaseModel):
         }
 
 
-def flatten_dict(d: dict, parent_items: dict = {}) -> dict:
+# The hyperion, detector and ispyb parameter keys for a type of InternalParameters
+ParamKeyDefinitions = tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+
+
+def flatten_dict(d: dict) -> dict:
     """Flatten a dictionary assuming all keys are unique."""
     items: dict = {}
-    for k, v in d.items():
-        if isinstance(v, dict):
-            flattened_subdict = flatten_dict(v, items)
-            items.update(flattened_subdict)
-        else:
-            if (
-                k in items
-                or k in parent_items
-                and (items.get(k) or parent_items.get(k)) != v
-            ):
+    # Walk the nested dicts depth first, keeping the keys in the order they appear
+    dicts_to_flatten = [iter(d.items())]
+    while dicts_to_flatten:
+        for k, v in dicts_to_flatten[-1]:
+            if isinstance(v, dict):
+                dicts_to_flatten.append(iter(v.items()))
+                break
+            if k in items and items[k] != v:
                 raise Exception(
                     f"Duplicate keys '{k}' in input parameters with differing values "
-                    f"'{v}' and '{(items.get(k) or parent_items.get(k))}'!"
+                    f"'{v}' and '{items[k]}'!"
                 )
             items[k] = v
+        else:
+            dicts_to_flatten.pop()
     return items
 
 
 def fetch_subdict_from_bucket(
-    list_of_keys: list[str], bucket: dict[str, Any]
+    list_of_keys: Sequence[str], bucket: dict[str, Any]
 ) -> dict[str, Any]:
-    return {key: bucket.get(key) for key in list_of_keys if bucket.get(key) is not None}
+    return {
+        key: value
+        for key in list_of_keys
+        if (value := bucket.get(key)) is not None
+    }
+
+
+@cache
+def annotation_keys(param_class: type) -> tuple[str, ...]:
+    """The field names of a parameter class, which don't change once defined."""
+    return tuple(param_class.__annotations__.keys())
 
 
 def extract_experiment_params_from_flat_dict(
     experiment_param_class, flat_params: dict[str, Any]
 ):
-    experiment_field_keys = list(experiment_param_class.__annotations__.keys())
+    experiment_field_keys = annotation_keys(experiment_param_class)
     experiment_params_args = fetch_subdict_from_bucket(
         experiment_field_keys, flat_params
     )
@@ -91,7 +106,7 @@ def get_extracted_experiment_and_flat_hyperion_params(
 
 def extract_hyperion_params_from_flat_dict(
     external_params: dict[str, Any],
-    hyperion_param_key_definitions: tuple[list[str], list[str], list[str]],
+    hyperion_param_key_definitions: ParamKeyDefinitions,
 ) -> dict[str, Any]:
     all_params_bucket = flatten_dict(external_params)
 
@@ -136,17 +151,19 @@ class InternalParameters(BaseModel):
         return values
 
     @staticmethod
-    def _hyperion_param_key_definitions():
-        hyperion_param_field_keys = [
+    @cache
+    def _hyperion_param_key_definitions() -> ParamKeyDefinitions:
+        hyperion_param_field_keys = (
             "zocalo_environment",
             "beamline",
             "insertion_prefix",
             "experiment_type",
-        ]
-        detector_field_keys = list(DetectorParams.__annotations__.keys())
-        # not an annotation but specified as field encoder in DetectorParams:
-        detector_field_keys.append("detector")
-        ispyb_field_keys = list(IspybParams.__annotations__.keys())
+        )
+        detector_field_keys = annotation_keys(DetectorParams) + (
+            # not an annotation but specified as field encoder in DetectorParams:
+            "detector",
+        )
+        ispyb_field_keys = annotation_keys(IspybParams)
         return hyperion_param_field_keys, detector_field_keys, ispyb_field_keys
 
     @abstractmethod
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 
 import numpy as np
@@ -12,6 +13,8 @@ from hyperion.external_interaction.ispyb.ispyb_dataclass import GridscanIspybPar
 from hyperion.parameters.internal_parameters import (
     HyperionParameters,
     InternalParameters,
+    ParamKeyDefinitions,
+    annotation_keys,
     extract_experiment_params_from_flat_dict,
     extract_hyperion_params_from_flat_dict,
 )
@@ -55,13 +58,14 @@ class GridScanWithEdgeDetectInternalParameters(InternalParameters):
         super().__init__(**args)
 
     @staticmethod
-    def _hyperion_param_key_definitions() -> tuple[list[str], list[str], list[str]]:
+    @cache
+    def _hyperion_param_key_definitions() -> ParamKeyDefinitions:
         (
             hyperion_param_field_keys,
             detector_field_keys,
             ispyb_field_keys,
         ) = InternalParameters._hyperion_param_key_definitions()
-        ispyb_field_keys += list(GridscanIspybParams.__annotations__.keys())
+        ispyb_field_keys += annotation_keys(GridscanIspybParams)
         return hyperion_param_field_keys, detector_field_keys, ispyb_field_keys
 
     @validator("experiment_params", pre=True)
@@ -81,7 +85,6 @@ class GridScanWithEdgeDetectInternalParameters(InternalParameters):
     ):
         experiment_params: GridScanWithEdgeDetectParams = values["experiment_params"]
         all_params["num_images"] = experiment_params.get_num_images()
-        all_params["position"] = np.array(all_params["position"])
         all_params["omega_increment"] = 0
         all_params["num_triggers"] = all_params["num_images"]
         all_params["num_images_per_trigger"] = 1
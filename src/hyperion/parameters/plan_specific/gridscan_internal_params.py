@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 
-import numpy as np
 from dodal.devices.detector import DetectorParams, TriggerMode
 from dodal.devices.fast_grid_scan import GridAxis, GridScanParams
 from pydantic import validator
@@ -16,6 +16,8 @@ from hyperion.external_interaction.ispyb.ispyb_dataclass import (
 from hyperion.parameters.internal_parameters import (
     HyperionParameters,
     InternalParameters,
+    ParamKeyDefinitions,
+    annotation_keys,
     extract_experiment_params_from_flat_dict,
     extract_hyperion_params_from_flat_dict,
 )
@@ -45,13 +47,14 @@ class GridscanInternalParameters(InternalParameters):
         }
 
     @staticmethod
-    def _hyperion_param_key_definitions() -> tuple[list[str], list[str], list[str]]:
+    @cache
+    def _hyperion_param_key_definitions() -> ParamKeyDefinitions:
         (
             hyperion_param_field_keys,
             detector_field_keys,
             ispyb_field_keys,
         ) = InternalParameters._hyperion_param_key_definitions()
-        ispyb_field_keys += list(GridscanIspybParams.__annotations__.keys())
+        ispyb_field_keys += annotation_keys(GridscanIspybParams)
         return hyperion_param_field_keys, detector_field_keys, ispyb_field_keys
 
     @validator("experiment_params", pre=True)
@@ -71,12 +74,10 @@ class GridscanInternalParameters(InternalParameters):
     ):
         experiment_params: GridScanParams = values["experiment_params"]
         all_params["num_images"] = experiment_params.get_num_images()
-        all_params["position"] = np.array(all_params["position"])
         all_params["omega_increment"] = 0
         all_params["num_triggers"] = all_params["num_images"]
         all_params["num_images_per_trigger"] = 1
         all_params["trigger_mode"] = TriggerMode.FREE_RUN
-        all_params["upper_left"] = np.array(all_params["upper_left"])
         hyperion_param_dict = extract_hyperion_params_from_flat_dict(
             all_params, cls._hyperion_param_key_definitions()
         )
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 
-import numpy as np
 from dodal.devices.detector import DetectorParams
 from dodal.devices.motors import XYZLimitBundle
 from dodal.devices.zebra import RotationDirection
@@ -18,6 +18,8 @@ from hyperion.external_interaction.ispyb.ispyb_dataclass import (
 from hyperion.parameters.internal_parameters import (
     HyperionParameters,
     InternalParameters,
+    ParamKeyDefinitions,
+    annotation_keys,
     extract_experiment_params_from_flat_dict,
     extract_hyperion_params_from_flat_dict,
 )
@@ -92,13 +94,14 @@ class RotationInternalParameters(InternalParameters):
         }
 
     @staticmethod
-    def _hyperion_param_key_definitions() -> tuple[list[str], list[str], list[str]]:
+    @cache
+    def _hyperion_param_key_definitions() -> ParamKeyDefinitions:
         (
             hyperion_param_field_keys,
             detector_field_keys,
             ispyb_field_keys,
         ) = InternalParameters._hyperion_param_key_definitions()
-        ispyb_field_keys += list(RotationIspybParams.__annotations__.keys())
+        ispyb_field_keys += annotation_keys(RotationIspybParams)
 
         return hyperion_param_field_keys, detector_field_keys, ispyb_field_keys
 
@@ -119,7 +122,6 @@ class RotationInternalParameters(InternalParameters):
     ):
         experiment_params: RotationScanParams = values["experiment_params"]
         all_params["num_images"] = experiment_params.get_num_images()
-        all_params["position"] = np.array(all_params["position"])
         if (
             all_params["rotation_axis"] == "omega"
             and all_params.get("rotation_increment") is not None
@@ -4,14 +4,21 @@ from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-resource = Resource(attributes={SERVICE_NAME: "hyperion"})
-jaeger_exporter = JaegerExporter(
-    agent_host_name="localhost",
-    agent_port=6831,
-)
-provider = TracerProvider(resource=resource)
-processor = BatchSpanProcessor(jaeger_exporter)
-provider.add_span_processor(processor)
-trace.set_tracer_provider(provider)
-
 TRACER = trace.get_tracer(__name__)
+
+
+def set_up_tracing():
+    """Export spans from TRACER to the local jaeger agent.
+
+    Until this is called TRACER produces no-op spans, so importing hyperion does not
+    start the exporter thread.
+    """
+    resource = Resource(attributes={SERVICE_NAME: "hyperion"})
+    jaeger_exporter = JaegerExporter(
+        agent_host_name="localhost",
+        agent_port=6831,
+    )
+    provider = TracerProvider(resource=resource)
+    processor = BatchSpanProcessor(jaeger_exporter)
+    provider.add_span_processor(processor)
+    trace.set_tracer_provider(provider)
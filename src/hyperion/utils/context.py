@@ -1,5 +1,16 @@
 import dataclasses
-from typing import Any, ClassVar, Dict, Protocol, Type, TypeVar, get_type_hints
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    get_type_hints,
+)
 
 from blueapi.core import BlueskyContext
 from blueapi.core.bluesky_types import Device
@@ -43,6 +54,17 @@ def find_device_in_context(
     return device
 
 
+@cache
+def _get_composite_fields(dc: Type[DT]) -> Tuple[Tuple[str, Any], ...]:
+    """The (name, expected type) of each field in the dataclass, resolved once per
+    class as get_type_hints is slow and the composites don't change"""
+    dc_type_hints: Dict[str, Any] = get_type_hints(dc)
+    return tuple(
+        (field.name, dc_type_hints.get(field.name, Device))
+        for field in dataclasses.fields(dc)
+    )
+
+
 def device_composite_from_context(context: BlueskyContext, dc: Type[DT]) -> DT:
     """
     Initializes all of the devices referenced in a given dataclass from a provided
@@ -56,18 +78,24 @@ def device_composite_from_context(context: BlueskyContext, dc: Type[DT]) -> DT:
     )
 
     devices: Dict[str, Any] = {}
-    dc_type_hints: Dict[str, Any] = get_type_hints(dc)
 
-    for field in dataclasses.fields(dc):
-        device = find_device_in_context(
-            context, field.name, expected_type=dc_type_hints.get(field.name, Device)
+    for name, expected_type in _get_composite_fields(dc):
+        devices[name] = find_device_in_context(
+            context, name, expected_type=expected_type
         )
 
-        # At the point where we're actually making a device composite, i.e. starting a plan with these devices,
-        # we need all the referenced devices to be connected.
-        _wait_for_connection(device=device)
-
-        devices[field.name] = device
+    # At the point where we're actually making a device composite, i.e. starting a plan with these devices,
+    # we need all the referenced devices to be connected. The connections are
+    # independent so wait for them all at once rather than one after another.
+    if devices:
+        with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+            # Consuming the results re-raises the first connection failure
+            list(
+                executor.map(
+                    lambda device: _wait_for_connection(device=device),
+                    devices.values(),
+                )
+            )
 
     return dc(**devices)
 
@@ -112,11 +112,17 @@ def patch_motor(motor):
     return patch.object(motor, "set", partial(mock_set, motor))
 
 
-@pytest.fixture
-def test_fgs_params():
+@pytest.fixture(scope="session")
+def session_fgs_params():
     return GridscanInternalParameters(**raw_params_from_file())
 
 
+@pytest.fixture
+def test_fgs_params(session_fgs_params: GridscanInternalParameters):
+    # Tests modify the parameters, so each gets its own copy
+    return session_fgs_params.copy(deep=True)
+
+
 @pytest.fixture
 def test_rotation_params():
     return RotationInternalParameters(
@@ -24,7 +24,6 @@ from hyperion.external_interaction.callbacks.xray_centre.callback_collection imp
 from hyperion.parameters.beamline_parameters import GDABeamlineParameters
 from hyperion.parameters.constants import BEAMLINE_PARAMETER_PATHS, SIM_BEAMLINE
 from hyperion.parameters.constants import DEV_ISPYB_DATABASE_CFG as ISPYB_CONFIG
-from hyperion.parameters.external_parameters import from_file as default_raw_params
 from hyperion.parameters.plan_specific.gridscan_internal_params import (
     GridscanInternalParameters,
 )
@@ -36,10 +35,9 @@ from ..external_interaction.conftest import (  # noqa
 
 
 @pytest.fixture
-def params():
-    params = GridscanInternalParameters(**default_raw_params())
-    params.hyperion_params.beamline = SIM_BEAMLINE
-    return params
+def params(test_fgs_params: GridscanInternalParameters):
+    test_fgs_params.hyperion_params.beamline = SIM_BEAMLINE
+    return test_fgs_params
 
 
 @pytest.fixture
@@ -200,7 +198,7 @@ def test_GIVEN_scan_invalid_WHEN_plan_run_THEN_ispyb_entry_made_but_no_zocalo_en
     callbacks = XrayCentreCallbackCollection.setup(params)
     callbacks.ispyb_handler.ispyb.ISPYB_CONFIG_PATH = ISPYB_CONFIG
     mock_start_zocalo = MagicMock()
-    callbacks.zocalo_handler.zocalo_interactor.run_start = mock_start_zocalo
+    callbacks.zocalo_handler.zocalo_interactor.run_start_many = mock_start_zocalo
 
     with pytest.raises(WarningException):
         RE(flyscan_xray_centre(fgs_composite, params))
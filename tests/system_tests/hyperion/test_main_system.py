@@ -6,7 +6,7 @@ import os
 import threading
 from dataclasses import dataclass
 from sys import argv
-from time import sleep
+from time import monotonic, sleep
 from typing import Any, Callable, Optional
 from unittest.mock import MagicMock, patch
 
@@ -45,7 +45,6 @@ TEST_PARAMS = json.dumps(
     )
 )
 
-SECS_PER_RUNENGINE_LOOP = 0.1
 RUNENGINE_TAKES_TIME_TIMEOUT = 15
 
 """
@@ -67,28 +66,36 @@ class MockRunEngine:
     test_name = "test"
 
     def __init__(self, test_name):
+        # Set first as every later attribute change notifies threads waiting on it
+        object.__setattr__(self, "_state_changed", threading.Condition())
         self.test_name = test_name
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        with self._state_changed:
+            super().__setattr__(name, value)
+            self._state_changed.notify_all()
+
     def __call__(self, *args: Any, **kwds: Any) -> Any:
-        time = 0.0
-        while self.RE_takes_time:
-            sleep(SECS_PER_RUNENGINE_LOOP)
-            time += SECS_PER_RUNENGINE_LOOP
-            if self.error:
-                raise self.error
-            if time > RUNENGINE_TAKES_TIME_TIMEOUT:
-                raise TimeoutError(
-                    f'Mock RunEngine thread for test "{self.test_name}" spun too long'
-                    "without an error. Most likely you should initialise with "
-                    "RE_takes_time=false, or set RE.error from another thread."
-                )
+        with self._state_changed:
+            finished = self._state_changed.wait_for(
+                lambda: self.error or not self.RE_takes_time,
+                timeout=RUNENGINE_TAKES_TIME_TIMEOUT,
+            )
         if self.error:
             raise self.error
+        if not finished:
+            raise TimeoutError(
+                f'Mock RunEngine thread for test "{self.test_name}" spun too long'
+                "without an error. Most likely you should initialise with "
+                "RE_takes_time=false, or set RE.error from another thread."
+            )
 
     def abort(self):
-        while self.aborting_takes_time:
-            sleep(SECS_PER_RUNENGINE_LOOP)
-            if self.error:
+        with self._state_changed:
+            self._state_changed.wait_for(
+                lambda: self.error or not self.aborting_takes_time
+            )
+            if self.error and self.aborting_takes_time:
                 raise self.error
         self.RE_takes_time = False
 
@@ -159,25 +166,26 @@ def test_env(request):
 def wait_for_run_engine_status(
     client: FlaskClient,
     status_check: Callable[[str], bool] = lambda status: status != Status.BUSY.value,
-    attempts=10,
+    timeout=2.0,
 ):
-    while attempts != 0:
-        response = client.get(STATUS_ENDPOINT)
-        response_json = json.loads(response.data)
+    # Back off exponentially as most status changes happen within a few milliseconds
+    deadline = monotonic() + timeout
+    delay = 0.001
+    while monotonic() < deadline:
+        response_json = client.get(STATUS_ENDPOINT).json
         LOGGER.debug(
-            f"Checking client status - response: {response_json}, attempts left={attempts}"
+            f"Checking client status - response: {response_json}, next check in {delay}s"
         )
         if status_check(response_json["status"]):
             return response_json
         else:
-            attempts -= 1
-            sleep(0.2)
+            sleep(delay)
+            delay = min(delay * 2, 0.2)
     assert False, "Run engine still busy"
 
 
 def check_status_in_response(response_object, expected_result: Status):
-    response_json = json.loads(response_object.data)
-    assert response_json["status"] == expected_result.value
+    assert response_object.json["status"] == expected_result.value
 
 
 def test_start_gives_success(test_env: ClientAndRunEngine):
@@ -1,6 +1,6 @@
+import threading
 from unittest.mock import patch
 
-import bluesky.plan_stubs as bps
 import pytest
 from bluesky.run_engine import RunEngine
 from dodal.beamlines import i03
@@ -37,25 +37,55 @@ def test_when_topup_before_end_of_collection_wait(
     fake_sleep.assert_called_once_with(60.0)
 
 
-@patch("hyperion.device_setup_plans.check_topup.bps.rd")
+@patch("hyperion.device_setup_plans.check_topup.wait_for_topup_complete")
 @patch("hyperion.device_setup_plans.check_topup.bps.sleep")
-def test_wait_for_topup_complete(fake_sleep, fake_rd, synchrotron):
-    def fake_generator(value):
-        yield from bps.null()
-        return value
-
-    fake_rd.side_effect = [
-        fake_generator(0.0),
-        fake_generator(0.0),
-        fake_generator(0.0),
-        fake_generator(10.0),
-    ]
+def test_when_topup_after_end_of_collection_no_wait_and_end_countdown_not_read(
+    fake_sleep, fake_wait, synchrotron: Synchrotron
+):
+    synchrotron.machine_status.synchrotron_mode.sim_put(SynchrotronMode.USER.value)  # type: ignore
+    synchrotron.top_up.start_countdown.sim_put(100.0)  # type: ignore
+    synchrotron.top_up.end_countdown.sim_put(120.0)  # type: ignore
+
+    RE = RunEngine()
+    with patch.object(
+        synchrotron.top_up.end_countdown, "read", autospec=True
+    ) as end_countdown_read:
+        RE(
+            check_topup_and_wait_if_necessary(
+                synchrotron=synchrotron,
+                total_exposure_time=40.0,
+                ops_time=30.0,
+            )
+        )
+    end_countdown_read.assert_not_called()
+    fake_sleep.assert_not_called()
+    fake_wait.assert_not_called()
+
+
+def test_wait_for_topup_complete_returns_once_topup_over(synchrotron: Synchrotron):
+    synchrotron.top_up.start_countdown.sim_put(0.0)  # type: ignore
+    topup_ended = threading.Event()
+
+    def end_topup():
+        topup_ended.set()
+        synchrotron.top_up.start_countdown.sim_put(10.0)  # type: ignore
+
+    threading.Timer(0.05, end_topup).start()
 
     RE = RunEngine()
     RE(wait_for_topup_complete(synchrotron))
 
-    assert fake_sleep.call_count == 3
-    fake_sleep.assert_called_with(0.1)
+    assert topup_ended.is_set()
+
+
+def test_wait_for_topup_complete_returns_immediately_if_no_topup(
+    synchrotron: Synchrotron,
+):
+    synchrotron.top_up.start_countdown.sim_put(10.0)  # type: ignore
+
+    messages = list(wait_for_topup_complete(synchrotron))
+
+    assert not any(msg.command in ("wait_for", "sleep") for msg in messages)
 
 
 @patch("hyperion.device_setup_plans.check_topup.bps.sleep")
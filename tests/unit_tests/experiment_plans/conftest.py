@@ -27,7 +27,7 @@ def modified_interactor_mock(assign_run_end: Callable | None = None):
     mock = MagicMock(spec=ZocaloInteractor)
     mock.wait_for_result.return_value = TEST_RESULT_LARGE
     if assign_run_end:
-        mock.run_end = assign_run_end
+        mock.run_end_many = assign_run_end
     return mock
 
 
@@ -1,3 +1,4 @@
+import threading
 import types
 from unittest.mock import MagicMock, call, patch
 
@@ -27,9 +28,6 @@ from hyperion.experiment_plans.flyscan_xray_centre_plan import (
     run_gridscan_and_move,
     wait_for_gridscan_valid,
 )
-from hyperion.external_interaction.callbacks.logging_callback import (
-    VerbosePlanExecutionLoggingCallback,
-)
 from hyperion.external_interaction.callbacks.xray_centre.callback_collection import (
     XrayCentreCallbackCollection,
 )
@@ -40,7 +38,6 @@ from hyperion.external_interaction.ispyb.store_in_ispyb import (
     IspybIds,
     Store3DGridscanInIspyb,
 )
-from hyperion.log import set_up_logging_handlers
 from hyperion.parameters import external_parameters
 from hyperion.parameters.constants import (
     GRIDSCAN_OUTER_PLAN,
@@ -63,6 +60,29 @@ from .conftest import (
 )
 
 
+HARDWARE_READ_DESCRIPTOR = {"uid": "123abc", "name": ISPYB_HARDWARE_READ_PLAN}
+HARDWARE_READ_EVENT = {
+    "descriptor": "123abc",
+    "data": {
+        "undulator_current_gap": 0,
+        "synchrotron_machine_status_synchrotron_mode": 0,
+        "s4_slit_gaps_xgap": 0,
+        "s4_slit_gaps_ygap": 0,
+    },
+}
+TRANSMISSION_FLUX_READ_DESCRIPTOR = {
+    "uid": "abc123",
+    "name": ISPYB_TRANSMISSION_FLUX_READ_PLAN,
+}
+TRANSMISSION_FLUX_READ_EVENT = {
+    "descriptor": "abc123",
+    "data": {
+        "attenuator_actual_transmission": 0,
+        "flux_flux_reading": 10,
+    },
+}
+
+
 @pytest.fixture
 def ispyb_plan(test_fgs_params):
     @bpp.set_run_key_decorator(GRIDSCAN_OUTER_PLAN)
@@ -79,6 +99,28 @@ def ispyb_plan(test_fgs_params):
     return standalone_read_hardware_for_ispyb
 
 
+@pytest.fixture
+def prepped_subscriptions(
+    mock_subscriptions: XrayCentreCallbackCollection,
+    test_fgs_params: GridscanInternalParameters,
+):
+    """The subscriptions with the ISPyB handler started and given the hardware
+    readings, as it would be partway through a gridscan"""
+    mock_subscriptions.ispyb_handler.activity_gated_start(
+        {
+            "subplan_name": GRIDSCAN_OUTER_PLAN,
+            "hyperion_internal_parameters": test_fgs_params.json(),
+        }
+    )
+    mock_subscriptions.ispyb_handler.activity_gated_descriptor(HARDWARE_READ_DESCRIPTOR)
+    mock_subscriptions.ispyb_handler.activity_gated_event(HARDWARE_READ_EVENT)
+    mock_subscriptions.ispyb_handler.activity_gated_descriptor(
+        TRANSMISSION_FLUX_READ_DESCRIPTOR
+    )
+    mock_subscriptions.ispyb_handler.activity_gated_event(TRANSMISSION_FLUX_READ_EVENT)
+    return mock_subscriptions
+
+
 @patch(
     "hyperion.external_interaction.callbacks.xray_centre.ispyb_callback.Store3DGridscanInIspyb",
     modified_store_grid_scan_mock,
@@ -168,6 +210,14 @@ class TestFlyscanXrayCentrePlan:
         )
         assert params.hyperion_params.ispyb_params.flux == flux_test_value  # type: ignore
 
+    @pytest.mark.parametrize(
+        "zocalo_result, expected_aperture",
+        [
+            (TEST_RESULT_LARGE, "LARGE"),
+            (TEST_RESULT_MEDIUM, "LARGE"),
+            (TEST_RESULT_SMALL, "MEDIUM"),
+        ],
+    )
     @patch(
         "dodal.devices.aperturescatterguard.ApertureScatterguard._safe_move_within_datacollection_range"
     )
@@ -182,97 +232,39 @@ class TestFlyscanXrayCentrePlan:
         move_x_y_z: MagicMock,
         run_gridscan: MagicMock,
         move_aperture: MagicMock,
+        zocalo_result: list,
+        expected_aperture: str,
         fake_fgs_composite: FlyScanXRayCentreComposite,
-        mock_subscriptions: XrayCentreCallbackCollection,
+        prepped_subscriptions: XrayCentreCallbackCollection,
         test_fgs_params: GridscanInternalParameters,
         RE: RunEngine,
     ):
-        set_up_logging_handlers(logging_level="INFO", dev_mode=True)
-        RE.subscribe(VerbosePlanExecutionLoggingCallback())
-
-        mock_subscriptions.ispyb_handler.activity_gated_start(
-            {
-                "subplan_name": GRIDSCAN_OUTER_PLAN,
-                "hyperion_internal_parameters": test_fgs_params.json(),
-            }
-        )
-        mock_subscriptions.ispyb_handler.activity_gated_descriptor(
-            {"uid": "123abc", "name": ISPYB_HARDWARE_READ_PLAN}
-        )
-        mock_subscriptions.ispyb_handler.activity_gated_event(
-            {
-                "descriptor": "123abc",
-                "data": {
-                    "undulator_current_gap": 0,
-                    "synchrotron_machine_status_synchrotron_mode": 0,
-                    "s4_slit_gaps_xgap": 0,
-                    "s4_slit_gaps_ygap": 0,
-                },
-            }
-        )
-        mock_subscriptions.ispyb_handler.activity_gated_descriptor(
-            {"uid": "abc123", "name": ISPYB_TRANSMISSION_FLUX_READ_PLAN}
-        )
-        mock_subscriptions.ispyb_handler.activity_gated_event(
-            {
-                "descriptor": "abc123",
-                "data": {
-                    "attenuator_actual_transmission": 0,
-                    "flux_flux_reading": 10,
-                },
-            }
-        )
+        move_aperture.return_value = Status(done=True, success=True)
 
-        mock_subscriptions.zocalo_handler.zocalo_interactor.wait_for_result.return_value = (
-            TEST_RESULT_LARGE
+        prepped_subscriptions.zocalo_handler.zocalo_interactor.wait_for_result.return_value = (
+            zocalo_result
         )
         RE(
             run_gridscan_and_move(
                 fake_fgs_composite,
                 test_fgs_params,
-                mock_subscriptions,
+                prepped_subscriptions,
             )
         )
-        mock_subscriptions.zocalo_handler.zocalo_interactor.wait_for_result.return_value = (
-            TEST_RESULT_MEDIUM
-        )
-        RE(
-            run_gridscan_and_move(
-                fake_fgs_composite,
-                test_fgs_params,
-                mock_subscriptions,
-            )
-        )
-        mock_subscriptions.zocalo_handler.zocalo_interactor.wait_for_result.return_value = (
-            TEST_RESULT_SMALL
-        )
-        RE(
-            run_gridscan_and_move(
-                fake_fgs_composite,
-                test_fgs_params,
-                mock_subscriptions,
-            )
-        )
-        assert fake_fgs_composite.aperture_scatterguard.aperture_positions is not None
-        ap_call_large = call(
-            *(fake_fgs_composite.aperture_scatterguard.aperture_positions.LARGE)
-        )
-        ap_call_medium = call(
-            *(fake_fgs_composite.aperture_scatterguard.aperture_positions.MEDIUM)
-        )
 
-        move_aperture.assert_has_calls(
-            [ap_call_large, ap_call_large, ap_call_medium], any_order=True
-        )
-
-        mv_call_large = call(
-            fake_fgs_composite.sample_motors, 0.05, pytest.approx(0.15), 0.25, wait=True
-        )
-        mv_call_medium = call(
-            fake_fgs_composite.sample_motors, 0.05, pytest.approx(0.15), 0.25, wait=True
+        assert fake_fgs_composite.aperture_scatterguard.aperture_positions is not None
+        move_aperture.assert_called_once_with(
+            *getattr(
+                fake_fgs_composite.aperture_scatterguard.aperture_positions,
+                expected_aperture,
+            )
         )
-        move_x_y_z.assert_has_calls(
-            [mv_call_large, mv_call_large, mv_call_medium], any_order=True
+        move_x_y_z.assert_called_once_with(
+            fake_fgs_composite.sample_motors,
+            0.05,
+            pytest.approx(0.15),
+            0.25,
+            group="move_to_result",
         )
 
     @patch("bluesky.plan_stubs.abs_set", autospec=True)
@@ -285,8 +277,6 @@ class TestFlyscanXrayCentrePlan:
     ):
         from hyperion.device_setup_plans.manipulate_sample import move_x_y_z
 
-        set_up_logging_handlers(logging_level="INFO", dev_mode=True)
-        RE.subscribe(VerbosePlanExecutionLoggingCallback())
         motor_position = (
             test_fgs_params.experiment_params.grid_position_to_motor_position(
                 np.array([1, 2, 3])
@@ -343,31 +333,14 @@ class TestFlyscanXrayCentrePlan:
         mock_subscriptions.ispyb_handler.activity_gated_start(td.test_start_document)
         mock_subscriptions.zocalo_handler.activity_gated_start(td.test_start_document)
         mock_subscriptions.ispyb_handler.activity_gated_descriptor(
-            {"uid": "123abc", "name": ISPYB_HARDWARE_READ_PLAN}
-        )
-
-        mock_subscriptions.ispyb_handler.activity_gated_event(
-            {
-                "descriptor": "123abc",
-                "data": {
-                    "undulator_current_gap": 0,
-                    "synchrotron_machine_status_synchrotron_mode": 0,
-                    "s4_slit_gaps_xgap": 0,
-                    "s4_slit_gaps_ygap": 0,
-                },
-            }
+            HARDWARE_READ_DESCRIPTOR
         )
+        mock_subscriptions.ispyb_handler.activity_gated_event(HARDWARE_READ_EVENT)
         mock_subscriptions.ispyb_handler.activity_gated_descriptor(
-            {"uid": "abc123", "name": ISPYB_TRANSMISSION_FLUX_READ_PLAN}
+            TRANSMISSION_FLUX_READ_DESCRIPTOR
         )
         mock_subscriptions.ispyb_handler.activity_gated_event(
-            {
-                "descriptor": "abc123",
-                "data": {
-                    "attenuator_actual_transmission": 0,
-                    "flux_flux_reading": 10,
-                },
-            }
+            TRANSMISSION_FLUX_READ_EVENT
         )
 
     @patch(
@@ -380,42 +353,12 @@ class TestFlyscanXrayCentrePlan:
         self,
         move_xyz: MagicMock,
         run_gridscan: MagicMock,
-        mock_subscriptions: XrayCentreCallbackCollection,
+        prepped_subscriptions: XrayCentreCallbackCollection,
         fake_fgs_composite: FlyScanXRayCentreComposite,
         test_fgs_params: GridscanInternalParameters,
         RE: RunEngine,
     ):
-        mock_subscriptions.ispyb_handler.activity_gated_descriptor(
-            {"uid": "123abc", "name": ISPYB_HARDWARE_READ_PLAN}
-        )
-
-        mock_subscriptions.ispyb_handler.activity_gated_event(
-            {
-                "descriptor": "123abc",
-                "data": {
-                    "undulator_current_gap": 0,
-                    "synchrotron_machine_status_synchrotron_mode": 0,
-                    "s4_slit_gaps_xgap": 0,
-                    "s4_slit_gaps_ygap": 0,
-                },
-            }
-        )
-        mock_subscriptions.ispyb_handler.activity_gated_descriptor(
-            {"uid": "abc123", "name": ISPYB_TRANSMISSION_FLUX_READ_PLAN}
-        )
-        mock_subscriptions.ispyb_handler.activity_gated_event(
-            {
-                "descriptor": "abc123",
-                "data": {
-                    "attenuator_actual_transmission": 0,
-                    "flux_flux_reading": 10,
-                },
-            }
-        )
-
-        set_up_logging_handlers(logging_level="INFO", dev_mode=True)
-        RE.subscribe(VerbosePlanExecutionLoggingCallback())
-        mock_subscriptions.zocalo_handler.wait_for_results = MagicMock(
+        prepped_subscriptions.zocalo_handler.wait_for_results = MagicMock(
             return_value=(
                 (0, 0, 0),
                 None,
@@ -426,7 +369,7 @@ class TestFlyscanXrayCentrePlan:
             run_gridscan_and_move(
                 fake_fgs_composite,
                 test_fgs_params,
-                mock_subscriptions,
+                prepped_subscriptions,
             )
         )
         assert (
@@ -481,43 +424,13 @@ class TestFlyscanXrayCentrePlan:
         self,
         move_xyz: MagicMock,
         run_gridscan: MagicMock,
-        mock_subscriptions: XrayCentreCallbackCollection,
+        prepped_subscriptions: XrayCentreCallbackCollection,
         fake_fgs_composite: FlyScanXRayCentreComposite,
         test_fgs_params: GridscanInternalParameters,
         RE: RunEngine,
     ):
         test_fgs_params.experiment_params.set_stub_offsets = False
-        mock_subscriptions.ispyb_handler.activity_gated_descriptor(
-            {"uid": "123abc", "name": ISPYB_HARDWARE_READ_PLAN}
-        )
-
-        mock_subscriptions.ispyb_handler.activity_gated_event(
-            {
-                "descriptor": "123abc",
-                "data": {
-                    "undulator_current_gap": 0,
-                    "synchrotron_machine_status_synchrotron_mode": 0,
-                    "s4_slit_gaps_xgap": 0,
-                    "s4_slit_gaps_ygap": 0,
-                },
-            }
-        )
-        mock_subscriptions.ispyb_handler.activity_gated_descriptor(
-            {"uid": "abc123", "name": ISPYB_TRANSMISSION_FLUX_READ_PLAN}
-        )
-        mock_subscriptions.ispyb_handler.activity_gated_event(
-            {
-                "descriptor": "abc123",
-                "data": {
-                    "attenuator_actual_transmission": 0,
-                    "flux_flux_reading": 10,
-                },
-            }
-        )
-
-        set_up_logging_handlers(logging_level="INFO", dev_mode=True)
-        RE.subscribe(VerbosePlanExecutionLoggingCallback())
-        mock_subscriptions.zocalo_handler.wait_for_results = MagicMock(
+        prepped_subscriptions.zocalo_handler.wait_for_results = MagicMock(
             return_value=(
                 (0, 0, 0),
                 None,
@@ -528,7 +441,7 @@ class TestFlyscanXrayCentrePlan:
             run_gridscan_and_move(
                 fake_fgs_composite,
                 test_fgs_params,
-                mock_subscriptions,
+                prepped_subscriptions,
             )
         )
         assert (
@@ -536,12 +449,7 @@ class TestFlyscanXrayCentrePlan:
             == 0
         )
 
-    @patch(
-        "hyperion.experiment_plans.flyscan_xray_centre_plan.bps.sleep", autospec=True
-    )
-    def test_GIVEN_scan_already_valid_THEN_wait_for_GRIDSCAN_returns_immediately(
-        self, patch_sleep: MagicMock, RE: RunEngine
-    ):
+    def test_GIVEN_scan_already_valid_THEN_wait_for_GRIDSCAN_returns_immediately(self):
         test_fgs: FastGridScan = make_fake_device(FastGridScan)(
             "prefix", name="fake_fgs"
         )
@@ -549,27 +457,36 @@ class TestFlyscanXrayCentrePlan:
         test_fgs.scan_invalid.sim_put(False)  # type: ignore
         test_fgs.position_counter.sim_put(0)  # type: ignore
 
-        RE(wait_for_gridscan_valid(test_fgs))
+        messages = list(wait_for_gridscan_valid(test_fgs))
 
-        patch_sleep.assert_not_called()
+        assert not any(msg.command == "wait_for" for msg in messages)
 
-    @patch(
-        "hyperion.experiment_plans.flyscan_xray_centre_plan.bps.sleep", autospec=True
-    )
-    def test_GIVEN_scan_not_valid_THEN_wait_for_GRIDSCAN_raises_and_sleeps_called(
-        self, patch_sleep: MagicMock, RE: RunEngine
+    def test_GIVEN_scan_becomes_valid_THEN_wait_for_GRIDSCAN_returns(
+        self, RE: RunEngine
     ):
         test_fgs: FastGridScan = make_fake_device(FastGridScan)(
             "prefix", name="fake_fgs"
         )
 
+        test_fgs.scan_invalid.sim_put(True)  # type: ignore
+        test_fgs.position_counter.sim_put(0)  # type: ignore
+        make_valid = threading.Timer(
+            0.05, lambda: test_fgs.scan_invalid.sim_put(False)  # type: ignore
+        )
+        make_valid.start()
+
+        RE(wait_for_gridscan_valid(test_fgs, timeout=5))
+
+    def test_GIVEN_scan_not_valid_THEN_wait_for_GRIDSCAN_raises(self, RE: RunEngine):
+        test_fgs: FastGridScan = make_fake_device(FastGridScan)(
+            "prefix", name="fake_fgs"
+        )
+
         test_fgs.scan_invalid.sim_put(True)  # type: ignore
         test_fgs.position_counter.sim_put(0)  # type: ignore
         with pytest.raises(WarningException):
             RE(wait_for_gridscan_valid(test_fgs))
 
-        patch_sleep.assert_called()
-
     @patch(
         "hyperion.experiment_plans.flyscan_xray_centre_plan.bps.abs_set", autospec=True
     )
@@ -622,11 +539,11 @@ class TestFlyscanXrayCentrePlan:
             autospec=True,
         ), patch(
             "hyperion.external_interaction.callbacks.xray_centre.zocalo_callback.ZocaloInteractor",
-            lambda _: modified_interactor_mock(mock_parent.run_end),
+            lambda _: modified_interactor_mock(mock_parent.run_end_many),
         ):
             RE(flyscan_xray_centre(fake_fgs_composite, test_fgs_params))
 
-        mock_parent.assert_has_calls([call.disarm(), call.run_end(0), call.run_end(0)])
+        mock_parent.assert_has_calls([call.disarm(), call.run_end_many((0, 0))])
 
     @patch("hyperion.experiment_plans.flyscan_xray_centre_plan.bps.wait", autospec=True)
     @patch(
@@ -178,7 +178,7 @@ def test_when_full_grid_scan_run_then_parameters_sent_to_fgs_as_expected(
 ):
     oav_params = OAVParameters("xrayCentring", test_config_files["oav_config_json"])
     mock_oav_callback = OavSnapshotCallback()
-    mock_oav_callback.snapshot_filenames = [["a", "b", "c"], ["d", "e", "f"]]
+    mock_oav_callback.snapshot_filenames = [["c", "b", "a"], ["f", "e", "d"]]
     mock_oav_callback.out_upper_left = [[1, 2], [1, 3]]
 
     mock_oav_callback_init.return_value = mock_oav_callback
@@ -93,8 +93,8 @@ def test_grid_detection_plan_runs_and_triggers_snapshots(
 
     assert len(cb.snapshot_filenames) == 2
     assert len(cb.snapshot_filenames[0]) == 3
-    assert cb.snapshot_filenames[0][0] == "tmp/test_0.png"
-    assert cb.snapshot_filenames[1][2] == "tmp/test_90_grid_overlay.png"
+    assert cb.snapshot_filenames[0][2] == "tmp/test_0.png"
+    assert cb.snapshot_filenames[1][0] == "tmp/test_90_grid_overlay.png"
 
     assert len(cb.out_upper_left) == 2
     assert len(cb.out_upper_left[0]) == 2
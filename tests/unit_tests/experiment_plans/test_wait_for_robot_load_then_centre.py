@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,6 +9,7 @@ from ophyd.sim import instantiate_fake_device
 
 from hyperion.experiment_plans.wait_for_robot_load_then_centre import (
     wait_for_robot_load_then_centre,
+    wait_for_smargon_not_disabled,
 )
 from hyperion.parameters.external_parameters import from_file as raw_params_from_file
 from hyperion.parameters.plan_specific.pin_centre_then_xray_centre_params import (
@@ -37,6 +39,7 @@ def test_when_plan_run_then_centring_plan_run_with_expected_parameters(
 ):
     mock_composite = MagicMock()
     mock_composite.smargon = instantiate_fake_device(Smargon, name="smargon")
+    mock_composite.smargon.disabled.sim_put(0)  # type: ignore
 
     RE = RunEngine()
     RE(
@@ -53,27 +56,13 @@ def test_when_plan_run_then_centring_plan_run_with_expected_parameters(
     assert isinstance(params_passed, PinCentreThenXrayCentreInternalParameters)
 
 
-def run_simulating_smargon_wait(
-    wait_for_robot_load_then_centre_params, total_disabled_reads
-):
+def run_simulating_smargon_wait(wait_for_robot_load_then_centre_params):
     mock_composite = MagicMock()
     mock_composite.smargon = instantiate_fake_device(Smargon, name="smargon")
+    mock_composite.smargon.disabled.sim_put(0)  # type: ignore
     mock_composite.eiger = instantiate_fake_device(EigerDetector, name="eiger")
 
-    num_of_reads = 0
-
-    def return_not_disabled_after_reads(_):
-        nonlocal num_of_reads
-        num_of_reads += 1
-        return {"values": {"value": int(num_of_reads < total_disabled_reads)}}
-
     sim = RunEngineSimulator()
-    sim.add_handler(
-        "read",
-        "smargon_disabled",
-        return_not_disabled_after_reads,
-    )
-
     return sim.simulate_plan(
         wait_for_robot_load_then_centre(
             mock_composite, wait_for_robot_load_then_centre_params
@@ -81,40 +70,47 @@ def run_simulating_smargon_wait(
     )
 
 
-@pytest.mark.parametrize("total_disabled_reads", [5, 3, 14])
 @patch(
     "hyperion.experiment_plans.wait_for_robot_load_then_centre.pin_tip_centre_then_xray_centre"
 )
 def test_given_smargon_disabled_when_plan_run_then_waits_on_smargon(
     mock_centring_plan: MagicMock,
     wait_for_robot_load_then_centre_params: WaitForRobotLoadThenCentreInternalParameters,
-    total_disabled_reads: int,
 ):
-    messages = run_simulating_smargon_wait(
-        wait_for_robot_load_then_centre_params, total_disabled_reads
-    )
+    mock_composite = MagicMock()
+    mock_composite.smargon = instantiate_fake_device(Smargon, name="smargon")
+    mock_composite.smargon.disabled.sim_put(1)  # type: ignore
 
-    mock_centring_plan.assert_called_once()
+    robot_load_finished = threading.Event()
+    centring_called_before_enabled = []
 
-    sleep_messages = filter(lambda msg: msg.command == "sleep", messages)
-    read_disabled_messages = filter(
-        lambda msg: msg.command == "read" and msg.obj.name == "smargon_disabled",
-        messages,
+    def enable_smargon():
+        # Asserting here would only fail the timer thread, so record for the test
+        centring_called_before_enabled.append(mock_centring_plan.called)
+        robot_load_finished.set()
+        mock_composite.smargon.disabled.sim_put(0)  # type: ignore
+
+    threading.Timer(0.05, enable_smargon).start()
+
+    RE = RunEngine()
+    RE(
+        wait_for_robot_load_then_centre(
+            mock_composite, wait_for_robot_load_then_centre_params
+        )
     )
 
-    assert len(list(sleep_messages)) == total_disabled_reads - 1
-    assert len(list(read_disabled_messages)) == total_disabled_reads
+    assert robot_load_finished.is_set()
+    assert centring_called_before_enabled == [False]
+    mock_centring_plan.assert_called_once()
 
 
-@patch(
-    "hyperion.experiment_plans.wait_for_robot_load_then_centre.pin_tip_centre_then_xray_centre"
-)
-def test_given_smargon_disabled_for_longer_than_timeout_when_plan_run_then_throws_exception(
-    mock_centring_plan: MagicMock,
-    wait_for_robot_load_then_centre_params: WaitForRobotLoadThenCentreInternalParameters,
-):
+def test_given_smargon_disabled_for_longer_than_timeout_when_plan_run_then_throws_exception():
+    smargon = instantiate_fake_device(Smargon, name="smargon")
+    smargon.disabled.sim_put(1)  # type: ignore
+
+    RE = RunEngine()
     with pytest.raises(TimeoutError):
-        run_simulating_smargon_wait(wait_for_robot_load_then_centre_params, 1000)
+        RE(wait_for_smargon_not_disabled(smargon, timeout=0.1))
 
 
 @patch(
@@ -124,14 +120,14 @@ def test_when_plan_run_then_detector_arm_started_before_wait_on_robot_load(
     mock_centring_plan: MagicMock,
     wait_for_robot_load_then_centre_params: WaitForRobotLoadThenCentreInternalParameters,
 ):
-    messages = run_simulating_smargon_wait(wait_for_robot_load_then_centre_params, 1)
+    messages = run_simulating_smargon_wait(wait_for_robot_load_then_centre_params)
 
     arm_detector_messages = filter(
         lambda msg: msg.command == "set" and msg.obj.name == "eiger_do_arm",
         messages,
     )
-    read_disabled_messages = filter(
-        lambda msg: msg.command == "read" and msg.obj.name == "smargon_disabled",
+    wait_for_enabled_messages = filter(
+        lambda msg: msg.command == "wait_for",
         messages,
     )
 
@@ -139,6 +135,8 @@ def test_when_plan_run_then_detector_arm_started_before_wait_on_robot_load(
     assert len(arm_detector_messages) == 1
 
     idx_of_arm_message = messages.index(arm_detector_messages[0])
-    idx_of_first_read_disabled_message = messages.index(list(read_disabled_messages)[0])
+    idx_of_wait_for_enabled_message = messages.index(
+        list(wait_for_enabled_messages)[0]
+    )
 
-    assert idx_of_arm_message < idx_of_first_read_disabled_message
+    assert idx_of_arm_message < idx_of_wait_for_enabled_message
@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock, patch
+
+import bluesky.plan_stubs as bps
+from bluesky.run_engine import RunEngine
+from ophyd.sim import SynAxis
+
+from hyperion.external_interaction.callbacks.logging_callback import (
+    VerbosePlanExecutionLoggingCallback,
+)
+
+
+@patch("hyperion.external_interaction.callbacks.logging_callback.LOGGER")
+def test_verbose_callback_logs_every_document(logger: MagicMock, RE: RunEngine):
+    RE.subscribe(VerbosePlanExecutionLoggingCallback())
+    motor = SynAxis(name="motor")
+
+    def plan():
+        yield from bps.open_run()
+        yield from bps.trigger_and_read([motor])
+        yield from bps.close_run()
+
+    RE(plan())
+
+    logged_prefixes = [
+        log_call.args[0].split(":")[0] for log_call in logger.info.call_args_list
+    ]
+    assert logged_prefixes == ["START", "DESCRIPTOR", "EVENT", "STOP"]
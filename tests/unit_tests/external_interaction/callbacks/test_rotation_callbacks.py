@@ -156,6 +156,20 @@ def test_nexus_handler_only_writes_once(
     cb.nexus_handler.writer.create_nexus_file.assert_called_once()
 
 
+@patch(
+    "hyperion.external_interaction.callbacks.rotation.nexus_callback.NexusWriter",
+    autospec=True,
+)
+def test_nexus_handler_raises_file_creation_error_on_start(
+    nexus_writer: MagicMock, test_start_doc
+):
+    nexus_writer.return_value.create_nexus_file.side_effect = OSError("disk full")
+    cb = RotationCallbackCollection.setup()
+
+    with pytest.raises(OSError, match="disk full"):
+        cb.nexus_handler.activity_gated_start(test_start_doc)
+
+
 @patch(
     "hyperion.external_interaction.callbacks.rotation.ispyb_callback.StoreRotationInIspyb",
     autospec=True,
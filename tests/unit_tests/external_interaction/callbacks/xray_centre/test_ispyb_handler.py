@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from dodal.log import LOGGER as dodal_logger
@@ -42,7 +42,7 @@ def mock_store_in_ispyb(config, params, *args, **kwargs) -> Store3DGridscanInIsp
     mock = Store3DGridscanInIspyb("", params)
     mock.store_grid_scan = MagicMock(return_value=[DC_IDS, None, DCG_ID])
     mock.get_current_time_string = MagicMock(return_value=td.DUMMY_TIME_STRING)
-    mock.update_scan_with_end_time_and_status = MagicMock(return_value=None)
+    mock.update_scans_with_end_time_and_status = MagicMock(return_value=None)
     return mock
 
 
@@ -68,21 +68,13 @@ class TestXrayCentreIspybHandler:
         )
         ispyb_handler.activity_gated_stop(td.test_run_gridscan_failed_stop_document)
 
-        ispyb_handler.ispyb.update_scan_with_end_time_and_status.assert_has_calls(
-            [
-                call(
-                    td.DUMMY_TIME_STRING,
-                    td.BAD_ISPYB_RUN_STATUS,
-                    "could not connect to devices",
-                    id,
-                    DCG_ID,
-                )
-                for id in DC_IDS
-            ]
-        )
-        assert (
-            ispyb_handler.ispyb.update_scan_with_end_time_and_status.call_count
-            == len(DC_IDS)
+        update_scans = ispyb_handler.ispyb.update_scans_with_end_time_and_status
+        update_scans.assert_called_once_with(
+            td.DUMMY_TIME_STRING,
+            td.BAD_ISPYB_RUN_STATUS,
+            "could not connect to devices",
+            DC_IDS,
+            DCG_ID,
         )
 
     def test_fgs_raising_no_exception_results_in_good_run_status_in_ispyb(
@@ -102,21 +94,13 @@ class TestXrayCentreIspybHandler:
         )
         ispyb_handler.activity_gated_stop(td.test_do_fgs_gridscan_stop_document)
 
-        ispyb_handler.ispyb.update_scan_with_end_time_and_status.assert_has_calls(
-            [
-                call(
-                    td.DUMMY_TIME_STRING,
-                    td.GOOD_ISPYB_RUN_STATUS,
-                    "",
-                    id,
-                    DCG_ID,
-                )
-                for id in DC_IDS
-            ]
-        )
-        assert (
-            ispyb_handler.ispyb.update_scan_with_end_time_and_status.call_count
-            == len(DC_IDS)
+        update_scans = ispyb_handler.ispyb.update_scans_with_end_time_and_status
+        update_scans.assert_called_once_with(
+            td.DUMMY_TIME_STRING,
+            td.GOOD_ISPYB_RUN_STATUS,
+            "",
+            DC_IDS,
+            DCG_ID,
         )
 
     def test_given_ispyb_callback_started_writing_to_ispyb_when_messages_logged_then_they_contain_dcgid(
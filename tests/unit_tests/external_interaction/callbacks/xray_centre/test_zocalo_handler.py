@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -43,8 +43,8 @@ def init_cbs_with_docs_and_mock_zocalo_and_ispyb(
         callbacks.ispyb_handler.activity_gated_start(td.test_start_document)
         callbacks.zocalo_handler.activity_gated_start(td.test_start_document)
     callbacks.zocalo_handler.zocalo_interactor.wait_for_result = MagicMock()
-    callbacks.zocalo_handler.zocalo_interactor.run_end = MagicMock()
-    callbacks.zocalo_handler.zocalo_interactor.run_start = MagicMock()
+    callbacks.zocalo_handler.zocalo_interactor.run_end_many = MagicMock()
+    callbacks.zocalo_handler.zocalo_interactor.run_start_many = MagicMock()
 
 
 class TestXrayCentreZocaloHandler:
@@ -87,19 +87,9 @@ class TestXrayCentreZocaloHandler:
         callbacks.ispyb_handler.activity_gated_stop(td.test_stop_document)
         callbacks.zocalo_handler.activity_gated_stop(td.test_stop_document)
 
-        callbacks.zocalo_handler.zocalo_interactor.run_start.assert_has_calls(
-            [call(x) for x in dc_ids]
-        )
-        assert callbacks.zocalo_handler.zocalo_interactor.run_start.call_count == len(
-            dc_ids
-        )
-
-        callbacks.zocalo_handler.zocalo_interactor.run_end.assert_has_calls(
-            [call(x) for x in dc_ids]
-        )
-        assert callbacks.zocalo_handler.zocalo_interactor.run_end.call_count == len(
-            dc_ids
-        )
+        zocalo_interactor = callbacks.zocalo_handler.zocalo_interactor
+        zocalo_interactor.run_start_many.assert_called_once_with(dc_ids)
+        zocalo_interactor.run_end_many.assert_called_once_with(dc_ids)
 
         callbacks.zocalo_handler.zocalo_interactor.wait_for_result.assert_not_called()
 
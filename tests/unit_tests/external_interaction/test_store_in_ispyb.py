@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import numpy as np
 import pytest
+from dodal.devices.detector import DetectorParams
 from ispyb.sp.mxacquisition import MXAcquisition
 from mockito import mock, when
 
@@ -480,6 +481,107 @@ def test_no_exception_during_run_results_in_good_run_status(
     assert "DataCollection Successful" in upserted_param_value_list
 
 
+@patch("ispyb.open", autospec=True)
+def test_3d_deposition_begins_and_ends_both_collections_over_one_connection(
+    mock_ispyb_conn: MagicMock,
+    dummy_ispyb_3d: Store3DGridscanInIspyb,
+):
+    setup_mock_return_values(mock_ispyb_conn)
+    mock_mx_aquisition = (
+        mock_ispyb_conn.return_value.__enter__.return_value.mx_acquisition
+    )
+    dummy_ispyb_3d.begin_deposition()
+    mock_mx_aquisition.upsert_data_collection.reset_mock()
+
+    dummy_ispyb_3d.end_deposition("fail", "test specifies failure")
+
+    mock_ispyb_conn.assert_called_once()
+    mock_ispyb_conn.return_value.__exit__.assert_called_once()
+    assert mock_mx_aquisition.update_data_collection_append_comments.call_count == 2
+    upserted_ids = [
+        upsert_call.args[0][0]
+        for upsert_call in mock_mx_aquisition.upsert_data_collection.call_args_list
+    ]
+    assert upserted_ids == TEST_DATA_COLLECTION_IDS
+
+
+@patch("ispyb.open", autospec=True)
+def test_rotation_failed_begin_deposition_releases_connection(
+    mock_ispyb_conn: MagicMock,
+    dummy_rotation_ispyb: StoreRotationInIspyb,
+):
+    setup_mock_return_values(mock_ispyb_conn)
+    mock_mx_aquisition = (
+        mock_ispyb_conn.return_value.__enter__.return_value.mx_acquisition
+    )
+    mock_mx_aquisition.upsert_data_collection_group.side_effect = Exception("no visit")
+    # A real connection doesn't suppress exceptions on exit
+    mock_ispyb_conn.return_value.__exit__.return_value = False
+
+    with pytest.raises(Exception, match="no visit"):
+        dummy_rotation_ispyb.begin_deposition()
+
+    mock_ispyb_conn.return_value.__exit__.assert_called_once()
+    *_, exc_type, exc, _ = mock_ispyb_conn.return_value.__exit__.call_args.args
+    assert exc_type is Exception and str(exc) == "no visit"
+
+
+@patch("ispyb.open", autospec=True)
+def test_3d_failed_begin_deposition_releases_connection(
+    mock_ispyb_conn: MagicMock,
+    dummy_ispyb_3d: Store3DGridscanInIspyb,
+):
+    setup_mock_return_values(mock_ispyb_conn)
+    mock_mx_aquisition = (
+        mock_ispyb_conn.return_value.__enter__.return_value.mx_acquisition
+    )
+    mock_mx_aquisition.upsert_data_collection_group.side_effect = Exception("no visit")
+    # A real connection doesn't suppress exceptions on exit
+    mock_ispyb_conn.return_value.__exit__.return_value = False
+
+    with pytest.raises(Exception, match="no visit"):
+        dummy_ispyb_3d.begin_deposition()
+
+    mock_ispyb_conn.return_value.__exit__.assert_called_once()
+    *_, exc_type, exc, _ = mock_ispyb_conn.return_value.__exit__.call_args.args
+    assert exc_type is Exception and str(exc) == "no visit"
+
+
+@patch("ispyb.open", autospec=True)
+def test_3d_deposition_looks_up_session_id_once(
+    mock_ispyb_conn: MagicMock,
+    dummy_ispyb_3d: Store3DGridscanInIspyb,
+):
+    setup_mock_return_values(mock_ispyb_conn)
+    mock_core = mock_ispyb_conn.return_value.__enter__.return_value.core
+
+    dummy_ispyb_3d.begin_deposition()
+
+    mock_core.retrieve_visit_id.assert_called_once()
+
+
+@patch("ispyb.open", autospec=True)
+def test_3d_deposition_stores_beam_position(
+    mock_ispyb_conn: MagicMock,
+    dummy_ispyb_3d: Store3DGridscanInIspyb,
+):
+    setup_mock_return_values(mock_ispyb_conn)
+
+    with patch.object(
+        DetectorParams, "get_beam_position_mm", return_value=(150.0, 160.0)
+    ):
+        dummy_ispyb_3d.begin_deposition()
+
+    mock_mx_acquisition = (
+        mock_ispyb_conn.return_value.__enter__.return_value.mx_acquisition
+    )
+    param_names = MXAcquisition.get_data_collection_params().keys()
+    for upsert_call in mock_mx_acquisition.upsert_data_collection.call_args_list:
+        upserted_params = dict(zip(param_names, upsert_call.args[0]))
+        assert upserted_params["xbeam"] == 150.0
+        assert upserted_params["ybeam"] == 160.0
+
+
 @patch("ispyb.open", autospec=True)
 def test_ispyb_deposition_comment_correct(
     mock_ispyb_conn: MagicMock,
@@ -96,6 +96,26 @@ def test__run_start_and_end(
     _test_zocalo(function_to_run, expected_message)
 
 
+@patch("zocalo.configuration.from_file", autospec=True)
+@patch("hyperion.external_interaction.zocalo.zocalo_interaction.lookup", autospec=True)
+def test_run_start_many_sends_a_message_per_dcid_over_one_connection(
+    mock_transport_lookup, mock_from_file
+):
+    mock_transport = MagicMock()
+    mock_transport_lookup.return_value.return_value = mock_transport
+
+    zc.run_start_many([1, 2])
+
+    mock_transport.connect.assert_called_once()
+    assert [
+        sent.args[1]["parameters"] for sent in mock_transport.send.call_args_list
+    ] == [
+        {"event": "start", "ispyb_dcid": 1},
+        {"event": "start", "ispyb_dcid": 2},
+    ]
+    mock_transport.disconnect.assert_called_once()
+
+
 @patch("workflows.recipe.wrap_subscribe", autospec=True)
 @patch("zocalo.configuration.from_file", autospec=True)
 @patch("hyperion.external_interaction.zocalo.zocalo_interaction.lookup", autospec=True)
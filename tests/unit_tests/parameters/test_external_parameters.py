@@ -1,6 +1,9 @@
 from os import environ
 from unittest.mock import patch
 
+import pytest
+from jsonschema import ValidationError
+
 from hyperion.parameters import external_parameters
 from hyperion.parameters.beamline_parameters import (
     GDABeamlineParameters,
@@ -19,6 +22,23 @@ def test_new_parameters_is_a_new_object():
     assert a is not b
 
 
+def test_parameter_schemas_are_loaded_once():
+    external_parameters._load_parameter_schemas.cache_clear()
+    for _ in range(2):
+        external_parameters.from_file(
+            "tests/test_data/parameter_json_files/test_parameters.json"
+        )
+    assert external_parameters._load_parameter_schemas.cache_info().misses == 1
+
+
+def test_invalid_parameters_still_fail_validation_once_schemas_loaded():
+    external_parameters.from_file(
+        "tests/test_data/parameter_json_files/test_parameters.json"
+    )
+    with pytest.raises(ValidationError, match="does not have enough properties"):
+        external_parameters.from_json('{"bad": 1}')
+
+
 def test_parameters_load_from_file():
     params = external_parameters.from_file(
         "tests/test_data/parameter_json_files/test_parameters.json"
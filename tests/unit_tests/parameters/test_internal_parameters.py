@@ -121,6 +121,23 @@ def test_flatten():
         flatten_dict({"x": 6, "y": {"x": 7}})
 
 
+def test_flatten_dict_detects_differing_duplicates_across_nested_levels():
+    with pytest.raises(Exception):
+        flatten_dict({"a": {"b": {"x": 1}}, "c": {"x": 2}})
+    with pytest.raises(Exception):
+        flatten_dict({"a": {"b": {"c": {"x": 1}}}, "x": 2})
+
+
+def test_flatten_dict_keeps_depth_first_key_order():
+    flat_dict = flatten_dict({"a": 1, "b": {"c": 2, "d": {"e": 3}}, "f": 4})
+    assert list(flat_dict.items()) == [("a", 1), ("c", 2), ("e", 3), ("f", 4)]
+
+
+def test_flatten_dict_allows_repeated_key_with_same_value_after_nested_dict():
+    flat_dict = flatten_dict({"a": {"x": 1}, "x": 1})
+    assert flat_dict == {"x": 1}
+
+
 def test_hyperion_params_needs_values_from_experiment(raw_params):
     extracted_hyperion_param_dict = extract_hyperion_params_from_flat_dict(
         flatten_dict(raw_params),
@@ -274,3 +291,4 @@ def test_internal_params_eq():
     internal_params_2 = copy.deepcopy(internal_params)
     internal_params_2.hyperion_params.experiment_type = "not_real_experiment"
     assert internal_params != internal_params_2
+
@@ -1,5 +1,6 @@
 import dataclasses
-from unittest.mock import MagicMock
+from typing import get_type_hints
+from unittest.mock import MagicMock, patch
 
 import pytest
 from ophyd.device import Device
@@ -69,3 +70,44 @@ def test_device_composite_from_context():
 
     assert composite.device2 == device2_instance
     assert isinstance(composite.device2, _DeviceType2)
+
+
+def test_device_composite_from_context_resolves_type_hints_once_per_class():
+    context = MagicMock()
+
+    @dataclasses.dataclass
+    class _Composite:
+        device1: _DeviceType1
+
+    context.find_device.return_value = MagicMock(spec=_DeviceType1)
+
+    with patch(
+        "hyperion.utils.context.get_type_hints", side_effect=get_type_hints
+    ) as mock_get_type_hints:
+        device_composite_from_context(context, _Composite)
+        device_composite_from_context(context, _Composite)
+
+    mock_get_type_hints.assert_called_once_with(_Composite)
+
+
+@patch("hyperion.utils.context._wait_for_connection")
+def test_device_composite_from_context_waits_for_every_device_and_raises_failures(
+    mock_wait_for_connection: MagicMock,
+):
+    context = MagicMock()
+
+    @dataclasses.dataclass
+    class _Composite:
+        device1: _DeviceType1
+        device2: _DeviceType1
+
+    context.find_device.side_effect = lambda name: MagicMock(
+        spec=_DeviceType1, name=name
+    )
+
+    device_composite_from_context(context, _Composite)
+    assert mock_wait_for_connection.call_count == 2
+
+    mock_wait_for_connection.side_effect = TimeoutError("not connected")
+    with pytest.raises(TimeoutError, match="not connected"):
+        device_composite_from_context(context, _Composite)